@@ -240,18 +240,21 @@ class DataAnalyzer:
                     if len(values) == 0:
                         continue
 
+                    # Quartiles and median in one quantile pass
+                    q25, median, q75 = values.quantile([0.25, 0.5, 0.75]).to_numpy()
+
                     # Basic statistics
                     stats_dict = {
                         "parameter": param_type,
                         "statistic_type": stat_type,
                         "count": len(values),
                         "mean": values.mean(),
-                        "median": values.median(),
+                        "median": median,
                         "std": values.std(),
                         "min": values.min(),
                         "max": values.max(),
-                        "q25": values.quantile(0.25),
-                        "q75": values.quantile(0.75),
+                        "q25": q25,
+                        "q75": q75,
                         "unit": (
                             param_data["unit"].iloc[0] if not param_data.empty else ""
                         ),
@@ -288,7 +291,7 @@ class DataAnalyzer:
             cv = values.std() / abs(values.mean()) if values.mean() != 0 else np.inf
 
             # IQR and outlier detection
-            q25, q75 = values.quantile(0.25), values.quantile(0.75)
+            q25, q75 = values.quantile([0.25, 0.75]).to_numpy()
             iqr = q75 - q25
             lower_bound = q25 - 1.5 * iqr
             upper_bound = q75 + 1.5 * iqr
@@ -543,7 +546,7 @@ class DataAnalyzer:
             return pd.DataFrame()
 
         try:
-            anomaly_results = []
+            anomaly_frames = []
 
             for param_type in data["parameter_type"].unique():
                 param_data = data[data["parameter_type"] == param_type]
@@ -576,44 +579,41 @@ class DataAnalyzer:
                         X.flatten() > (Q3 + 1.5 * IQR)
                     )
 
-                    # Combine anomaly detection results
-                    for i, (timestamp, value) in enumerate(
-                        zip(timestamps, X.flatten())
-                    ):
-                        anomaly_score = 0
-                        anomaly_methods = []
-
-                        if iso_anomalies[i] == -1:
-                            anomaly_score += 1
-                            anomaly_methods.append("IsolationForest")
-
-                        if z_anomalies[i]:
-                            anomaly_score += 1
-                            anomaly_methods.append("Z-score")
-
-                        if iqr_anomalies[i]:
-                            anomaly_score += 1
-                            anomaly_methods.append("IQR")
-
-                        if anomaly_score > 0:
-                            anomaly_results.append(
-                                {
-                                    "datetime": timestamp,
-                                    "parameter_type": param_type,
-                                    "statistic_type": stat_type,
-                                    "value": value,
-                                    "anomaly_score": anomaly_score,
-                                    "anomaly_methods": ", ".join(anomaly_methods),
-                                    "severity": (
-                                        "High"
-                                        if anomaly_score >= 2
-                                        else "Medium" if anomaly_score == 1 else "Low"
-                                    ),
-                                }
-                            )
-
-            if anomaly_results:
-                return pd.DataFrame(anomaly_results)
+                    # Combine anomaly detection results: one score per point, then
+                    # build the rows for flagged points straight from the arrays
+                    iso_flags = iso_anomalies == -1
+                    anomaly_scores = iso_flags.astype(int) + z_anomalies + iqr_anomalies
+                    flagged = np.flatnonzero(anomaly_scores)
+                    if flagged.size == 0:
+                        continue
+
+                    method_flags = np.column_stack(
+                        (iso_flags[flagged], z_anomalies[flagged], iqr_anomalies[flagged])
+                    ).tolist()
+                    flagged_scores = anomaly_scores[flagged]
+                    anomaly_frames.append(
+                        pd.DataFrame(
+                            {
+                                "datetime": timestamps[flagged],
+                                "parameter_type": param_type,
+                                "statistic_type": stat_type,
+                                "value": X.flatten()[flagged],
+                                "anomaly_score": flagged_scores,
+                                "anomaly_methods": [
+                                    ", ".join(
+                                        method
+                                        for method, hit in zip(("IsolationForest", "Z-score", "IQR"), row)
+                                        if hit
+                                    )
+                                    for row in method_flags
+                                ],
+                                "severity": np.where(flagged_scores >= 2, "High", "Medium"),
+                            }
+                        )
+                    )
+
+            if anomaly_frames:
+                return pd.concat(anomaly_frames, ignore_index=True)
             else:
                 return pd.DataFrame()
 
@@ -99,18 +99,24 @@ class DataAnalyzer:
             # Get threshold configuration
             thresholds = self.parameter_thresholds.get(parameter, {})
             
-            # Basic statistics
+            # Basic statistics - reduce each statistic once; std reuses the mean
+            arr = values.to_numpy(dtype=float)
+            mean_val = float(arr.mean())
+            std_val = float(np.sqrt(np.square(arr - mean_val).sum() / (arr.size - 1))) if arr.size > 1 else float('nan')
+            min_val = float(arr.min())
+            max_val = float(arr.max())
+            
             analysis = {
                 "parameter": parameter,
                 "count": len(values),
-                "mean": float(values.mean()),
+                "mean": mean_val,
                 "median": float(values.median()),
-                "std": float(values.std()),
-                "min": float(values.min()),
-                "max": float(values.max()),
-                "cv": float(values.std() / values.mean()) if values.mean() != 0 else float('inf'),
+                "std": std_val,
+                "min": min_val,
+                "max": max_val,
+                "cv": std_val / mean_val if mean_val != 0 else float('inf'),
                 "unit": thresholds.get("unit", ""),
-                "data_range": f"{values.min():.3f} to {values.max():.3f}"
+                "data_range": f"{min_val:.3f} to {max_val:.3f}"
             }
             
             # Quality assessment
@@ -146,11 +152,12 @@ class DataAnalyzer:
         # Compliance rates
         within_range = ((values >= min_thresh) & (values <= max_thresh)).sum()
         within_optimal = ((values >= optimal_min) & (values <= optimal_max)).sum()
+        cv_ok = values.std() / values.mean() <= cv_threshold
         
         analysis.update({
             "range_compliance": float(within_range / len(values) * 100),
             "optimal_compliance": float(within_optimal / len(values) * 100),
-            "cv_compliance": "PASS" if values.std() / values.mean() <= cv_threshold else "FAIL",
+            "cv_compliance": "PASS" if cv_ok else "FAIL",
             "threshold_min": min_thresh,
             "threshold_max": max_thresh,
             "optimal_min": optimal_min,
@@ -160,7 +167,7 @@ class DataAnalyzer:
         # Overall quality score
         range_score = within_range / len(values)
         optimal_score = within_optimal / len(values)
-        cv_score = 1.0 if values.std() / values.mean() <= cv_threshold else 0.5
+        cv_score = 1.0 if cv_ok else 0.5
         
         quality_score = (range_score * 0.4 + optimal_score * 0.4 + cv_score * 0.2) * 100
         
@@ -215,9 +222,8 @@ class DataAnalyzer:
     def _detect_outliers(self, values: pd.Series) -> Dict:
         """Detect outliers using multiple methods"""
         try:
-            # IQR method
-            Q1 = values.quantile(0.25)
-            Q3 = values.quantile(0.75)
+            # IQR method (both quartiles from one sort of the NaN-free values)
+            Q1, Q3 = np.quantile(values.to_numpy(dtype=float), [0.25, 0.75])
             IQR = Q3 - Q1
             lower_bound = Q1 - 1.5 * IQR
             upper_bound = Q3 + 1.5 * IQR
@@ -358,8 +364,7 @@ class DataAnalyzer:
                 return pd.DataFrame()
             
             if method == "iqr":
-                Q1 = values.quantile(0.25)
-                Q3 = values.quantile(0.75)
+                Q1, Q3 = np.quantile(values.to_numpy(dtype=float), [0.25, 0.75])
                 IQR = Q3 - Q1
                 lower_bound = Q1 - 1.5 * IQR
                 upper_bound = Q3 + 1.5 * IQR
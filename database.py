@@ -9,6 +9,7 @@ import pandas as pd
 from typing import Optional, Dict, List
 import os
 from functools import reduce
+from itertools import chain, islice
 import time
 import traceback
 from contextlib import contextmanager
@@ -32,9 +33,13 @@ class DatabaseManager:
             
         self.connection_pool = {}
         self.prepared_statements = {}
+        # ':memory:' databases live in the pooled connection, so each thread
+        # sees its own copy and there is no file to check, sync or back up
+        self.in_memory = self.db_path == ":memory:"
         
         # Setup crash recovery and backup system
-        self._setup_database_resilience()
+        if not self.in_memory:
+            self._setup_database_resilience()
         
         # Initialize database
         self.init_db()
@@ -94,8 +99,7 @@ class DatabaseManager:
         """Initialize database with enhanced schema and performance optimizations"""
         with self.get_connection() as conn:
             # Enable performance optimizations
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
+            self._apply_journal_pragmas(conn)
             conn.execute("PRAGMA cache_size=50000")  # Increased cache size
             conn.execute("PRAGMA temp_store=MEMORY")
             conn.execute("PRAGMA mmap_size=268435456")  # 256MB memory mapping
@@ -184,6 +188,15 @@ class DatabaseManager:
             if idx_name not in existing_indices:
                 conn.execute(idx_query)
 
+    def _apply_journal_pragmas(self, conn):
+        """Set journaling and sync mode; in-memory databases have nothing to sync"""
+        if self.in_memory:
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            conn.execute("PRAGMA synchronous=OFF")
+        else:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+
     @contextmanager
     def get_connection(self):
         """Get a database connection with thread safety and performance optimizations"""
@@ -200,8 +213,7 @@ class DatabaseManager:
             
             # Apply performance optimizations to new connections
             conn.execute("PRAGMA foreign_keys=ON")
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
+            self._apply_journal_pragmas(conn)
             conn.execute("PRAGMA cache_size=50000")
             conn.execute("PRAGMA temp_store=MEMORY")
             conn.execute("PRAGMA mmap_size=268435456")
@@ -259,24 +271,16 @@ class DatabaseManager:
                     if col not in df_clean.columns:
                         df_clean[col] = None
 
-                # Prepare the insert statement once
-                insert_sql = """
-                    INSERT INTO water_logs
-                    (datetime, serial_number, parameter_type, statistic_type,
-                     value, count, unit, description, data_quality,
-                     raw_parameter, line_number)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-
-                # Process in batches for memory efficiency
-                for start_idx in range(0, len(df_clean), batch_size):
-                    end_idx = min(start_idx + batch_size, len(df_clean))
-                    batch_df = df_clean.iloc[start_idx:end_idx]
-                    data_to_insert = batch_df[columns_to_insert].values.tolist()
+                # Stream plain row tuples in batches for memory efficiency
+                rows = df_clean[columns_to_insert].itertuples(index=False, name=None)
+                while True:
+                    data_to_insert = list(islice(rows, batch_size))
+                    if not data_to_insert:
+                        break
 
                     # Execute batch insert
-                    conn.executemany(insert_sql, data_to_insert)
-                    total_inserted += len(batch_df)
+                    self._chunked_multi_insert(conn, data_to_insert)
+                    total_inserted += len(data_to_insert)
 
                     # Intermediate commit for very large datasets to avoid transaction overhead
                     if total_inserted % 10000 == 0:
@@ -299,6 +303,74 @@ class DatabaseManager:
 
         return total_inserted
 
+    def bulk_load(self, df: pd.DataFrame) -> int:
+        """Load a DataFrame, deferring index maintenance when water_logs is empty.
+
+        On a fresh table the secondary indices are dropped, the rows inserted
+        and the indices rebuilt in one sorted pass, which is cheaper than
+        updating six B-trees per row. Non-empty tables fall back to
+        insert_data_batch unchanged.
+        """
+        if df.empty:
+            return 0
+
+        with self.get_connection() as conn:
+            if conn.execute("SELECT 1 FROM water_logs LIMIT 1").fetchone():
+                return self.insert_data_batch(df)
+
+            index_names = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index' "
+                    "AND tbl_name='water_logs' AND name NOT LIKE 'sqlite_%'"
+                )
+            ]
+            for idx_name in index_names:
+                conn.execute(f"DROP INDEX IF EXISTS {idx_name}")
+
+            try:
+                return self.insert_data_batch(df)
+            finally:
+                self._create_indices(conn)
+
+    def _chunked_multi_insert(self, conn, rows: List[tuple], rows_per_stmt: int = 90):
+        """Insert water_logs rows using multi-row VALUES statements.
+
+        Full chunks go through one ``INSERT ... VALUES (...),(...)`` statement
+        each, cutting per-statement overhead inside SQLite; the leftover rows
+        use the single-row statement via executemany. 90 rows x 11 columns
+        stays under SQLite's historical 999 bound-parameter limit.
+        """
+        columns = (
+            "datetime, serial_number, parameter_type, statistic_type, "
+            "value, count, unit, description, data_quality, "
+            "raw_parameter, line_number"
+        )
+        placeholders = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+        # SQL text is built once per chunk size; sqlite3 caches the compiled
+        # statement by text, so repeated executes skip the prepare step
+        multi_sql = self.prepared_statements.get(("water_logs", rows_per_stmt))
+        if multi_sql is None:
+            multi_sql = (
+                f"INSERT INTO water_logs ({columns}) VALUES "
+                + ", ".join([placeholders] * rows_per_stmt)
+            )
+            self.prepared_statements[("water_logs", rows_per_stmt)] = multi_sql
+
+        full_end = len(rows) - len(rows) % rows_per_stmt
+        for start_idx in range(0, full_end, rows_per_stmt):
+            conn.execute(
+                multi_sql,
+                list(chain.from_iterable(rows[start_idx:start_idx + rows_per_stmt])),
+            )
+
+        if full_end < len(rows):
+            conn.executemany(
+                f"INSERT INTO water_logs ({columns}) VALUES {placeholders}",
+                rows[full_end:],
+            )
+
     def insert_file_metadata(
         self, filename: str, file_size: int, records_imported: int, parsing_stats: str
     ):
@@ -318,14 +390,27 @@ class DatabaseManager:
             traceback.print_exc()
 
     def get_all_logs(
-        self, limit: Optional[int] = None, chunk_size: int = None
+        self,
+        limit: Optional[int] = None,
+        chunk_size: int = None,
+        columns: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """
         Get all logs with memory-optimized processing for large datasets
+
+        ``columns`` limits the result to those output columns; statistic
+        types that are not requested are never queried or merged (so rows
+        that only carry an unrequested statistic are absent), and the
+        ``param``/``serial`` columns come back as categoricals.
         """
         try:
             with self.get_connection() as conn:
                 stats = ["avg", "min", "max"]
+                if columns is not None:
+                    wanted = set(columns)
+                    if "diff" in wanted:
+                        wanted.update(("min", "max"))
+                    stats = [stat for stat in stats if stat in wanted] or ["avg"]
                 frames = []
 
                 # Process each statistic type separately for memory efficiency
@@ -402,6 +487,12 @@ class DatabaseManager:
                 else:
                     df_merged["diff"] = 0
                 
+                if columns is not None:
+                    df_merged = df_merged[[col for col in columns if col in df_merged.columns]]
+                    df_merged = df_merged.astype(
+                        {col: "category" for col in ("param", "serial") if col in df_merged.columns}
+                    )
+
                 print(f"Final merged dataset: {len(df_merged)} records with columns: {list(df_merged.columns)}")
 
                 return df_merged
@@ -690,6 +781,8 @@ class DatabaseManager:
 
     def vacuum_database(self):
         """Optimize database by running VACUUM"""
+        if self.in_memory:
+            return
         try:
             # VACUUM requires its own connection
             with sqlite3.connect(self.db_path) as conn:
@@ -701,6 +794,8 @@ class DatabaseManager:
 
     def get_database_size(self) -> int:
         """Get database file size in bytes with error handling"""
+        if self.in_memory:
+            return 0
         try:
             return os.path.getsize(self.db_path)
         except Exception as e:
@@ -769,7 +864,11 @@ class DatabaseManager:
         """Cleanup database connections on object destruction"""
         try:
             # Create backup before closing if database was modified
-            if hasattr(self, 'backup_manager') and os.path.exists(self.db_path):
+            if (
+                hasattr(self, 'backup_manager')
+                and not getattr(self, 'in_memory', False)
+                and os.path.exists(self.db_path)
+            ):
                 self.backup_manager.create_backup(self.db_path)
                 
             # Close all pooled connections
@@ -12,6 +12,43 @@ import re
 from typing import Dict, List, Tuple, Optional, Set
 
 
+# Separators stripped when normalizing parameter names (same set as r'[_\s\-]+'
+# for the ASCII names used in LINAC logs); str.translate avoids a regex per lookup
+_SEPARATOR_TABLE = str.maketrans('', '', '_- \t\n\r\f\v')
+
+def _trie_pattern(words) -> str:
+    """Build a regex alternation with shared prefixes factored into a trie.
+
+    re tries alternatives one after another at each position; factoring the
+    prefixes means each character is examined once per trie level, giving a
+    single Aho-Corasick style pass over the line instead of one substring
+    search per word.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict) -> Optional[str]:
+        if '' in node and len(node) == 1:
+            return None
+        alternatives = [
+            re.escape(char) + (build(child) or '')
+            for char, child in sorted(item for item in node.items() if item[0])
+        ]
+        body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie) or ''
+
+
+# Parsed mapedname.txt contents per (absolute path, mtime_ns, size), so every
+# mapper built in one process after the first skips re-reading the file
+_MAPPING_CACHE: Dict[Tuple[str, int, int], Dict[str, Dict]] = {}
+
+
 class EnhancedParameterMapper:
     """
     Streamlined parameter mapper focused on strict filtering using mapedname.txt.
@@ -25,15 +62,40 @@ class EnhancedParameterMapper:
         # O(1) lookup sets for efficient filtering
         self.parameter_allowlist: Set[str] = set()
         self.parameter_variations: Set[str] = set()
+        # Frozen snapshot of the allowlist so hot callers can test membership
+        # directly and only fall back to is_parameter_allowed() on a miss
+        self.allowed_set: frozenset = frozenset()
+        # Single compiled matcher for "does this line mention any variation"
+        self.variations_re: Optional[re.Pattern] = None
         
         # Merged parameter configuration for equivalent parameters
         self.merged_parameters: Dict[str, List[str]] = {}
         
-        # Load parameter mappings from mapedname.txt
-        self._load_parameter_mappings()
+        # Load parameter mappings from mapedname.txt (reused if unchanged)
+        self._load_cached()
         self._setup_parameter_merging()
         self._create_parameter_allowlist()
     
+    def _load_cached(self):
+        """Load mappings, reusing an earlier parse of an unchanged mapedname.txt"""
+        try:
+            stat = os.stat(self.mapedname_file_path)
+        except OSError:
+            self._load_parameter_mappings()
+            return
+        
+        key = (os.path.abspath(self.mapedname_file_path), stat.st_mtime_ns, stat.st_size)
+        cached = _MAPPING_CACHE.get(key)
+        if cached is not None:
+            # Per-instance copies: merging setup adjusts category/priority in place
+            self.parameter_mapping = {name: dict(config) for name, config in cached.items()}
+            print(f"✅ Loaded {len(self.parameter_mapping)} parameter mappings from mapedname.txt (cached)")
+            return
+        
+        self._load_parameter_mappings()
+        if self.parameter_mapping:
+            _MAPPING_CACHE[key] = {name: dict(config) for name, config in self.parameter_mapping.items()}
+
     def _load_parameter_mappings(self):
         """Load parameter mappings from mapedname.txt file with strict filtering"""
         try:
@@ -168,7 +230,7 @@ class EnhancedParameterMapper:
             variations = [
                 machine_name,
                 machine_name.lower(),
-                re.sub(r'[_\s\-]+', '', machine_name.lower()),
+                machine_name.lower().translate(_SEPARATOR_TABLE),
                 re.sub(r'statistics$', '', machine_name.lower(), flags=re.IGNORECASE)
             ]
             
@@ -183,6 +245,10 @@ class EnhancedParameterMapper:
                 self.parameter_allowlist.add(source_param.lower())
                 self.parameter_variations.add(source_param.lower())
         
+        self.allowed_set = frozenset(self.parameter_allowlist)
+        variations = [variation for variation in self.parameter_variations if variation]
+        self.variations_re = re.compile(_trie_pattern(variations)) if variations else None
+        
         print(f"🔒 Created parameter allowlist with {len(self.parameter_allowlist)} entries for strict filtering")
 
     def is_parameter_allowed(self, parameter_name: str) -> bool:
@@ -194,13 +260,17 @@ class EnhancedParameterMapper:
             return False
         
         # Check against allowlist with O(1) lookup
-        if parameter_name in self.parameter_allowlist:
+        if parameter_name in self.allowed_set:
             return True
         
         # Check parameter variations
-        cleaned = re.sub(r'[_\s\-]+', '', parameter_name.lower())
+        cleaned = parameter_name.lower().translate(_SEPARATOR_TABLE)
         return cleaned in self.parameter_variations
 
+    def line_mentions_allowed_parameter(self, line_lower: str) -> bool:
+        """True if a lower-cased log line contains any allowed parameter variation"""
+        return self.variations_re is not None and self.variations_re.search(line_lower) is not None
+
     def map_parameter_name(self, parameter_name: str) -> Dict[str, str]:
         """Map parameter name to friendly name and unit"""
         # Direct lookup first
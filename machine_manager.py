@@ -13,10 +13,26 @@ Company: gobioeng.com
 """
 
 import pandas as pd
+from itertools import cycle
 from typing import Dict, List, Optional, Any
 from database import DatabaseManager
 
 
+# Professional color palette for multiple machines
+MACHINE_COLOR_PALETTE = (
+    '#2196F3',  # Blue
+    '#4CAF50',  # Green  
+    '#FF9800',  # Orange
+    '#9C27B0',  # Purple
+    '#F44336',  # Red
+    '#00BCD4',  # Cyan
+    '#795548',  # Brown
+    '#607D8B',  # Blue Grey
+    '#E91E63',  # Pink
+    '#3F51B5',  # Indigo
+)
+
+
 class MachineManager:
     """Manages machine-specific datasets and analysis contexts for multi-machine support"""
     
@@ -329,22 +345,5 @@ class MachineManager:
         """
         machines = self.get_available_machines() if not self._selected_machines else self._selected_machines
         
-        # Professional color palette for multiple machines
-        colors = [
-            '#2196F3',  # Blue
-            '#4CAF50',  # Green  
-            '#FF9800',  # Orange
-            '#9C27B0',  # Purple
-            '#F44336',  # Red
-            '#00BCD4',  # Cyan
-            '#795548',  # Brown
-            '#607D8B',  # Blue Grey
-            '#E91E63',  # Pink
-            '#3F51B5',  # Indigo
-        ]
-        
-        machine_colors = {}
-        for i, machine in enumerate(machines):
-            machine_colors[machine] = colors[i % len(colors)]
-        
-        return machine_colors
\ No newline at end of file
+        # Assign all colors in one pass, wrapping around the palette
+        return dict(zip(machines, cycle(MACHINE_COLOR_PALETTE)))
\ No newline at end of file
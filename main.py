@@ -772,25 +772,25 @@ class HALogApp:
 
                     # NEW TREND DROPDOWN CHANGE EVENTS (auto-update on selection)
                     if hasattr(self.ui, 'comboWaterTopGraph'):
-                        self.ui.comboWaterTopGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('flow'))
+                        self.ui.comboWaterTopGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('flow'))
                     if hasattr(self.ui, 'comboWaterBottomGraph'):
-                        self.ui.comboWaterBottomGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('flow'))
+                        self.ui.comboWaterBottomGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('flow'))
                     if hasattr(self.ui, 'comboVoltageTopGraph'):
-                        self.ui.comboVoltageTopGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('voltage'))
+                        self.ui.comboVoltageTopGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('voltage'))
                     if hasattr(self.ui, 'comboVoltageBottomGraph'):
-                        self.ui.comboVoltageBottomGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('voltage'))
+                        self.ui.comboVoltageBottomGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('voltage'))
                     if hasattr(self.ui, 'comboTempTopGraph'):
-                        self.ui.comboTempTopGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('temperature'))
+                        self.ui.comboTempTopGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('temperature'))
                     if hasattr(self.ui, 'comboTempBottomGraph'):
-                        self.ui.comboTempBottomGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('temperature'))
+                        self.ui.comboTempBottomGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('temperature'))
                     if hasattr(self.ui, 'comboHumidityTopGraph'):
-                        self.ui.comboHumidityTopGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('humidity'))
+                        self.ui.comboHumidityTopGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('humidity'))
                     if hasattr(self.ui, 'comboHumidityBottomGraph'):
-                        self.ui.comboHumidityBottomGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('humidity'))
+                        self.ui.comboHumidityBottomGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('humidity'))
                     if hasattr(self.ui, 'comboFanTopGraph'):
-                        self.ui.comboFanTopGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('fan_speed'))
+                        self.ui.comboFanTopGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('fan_speed'))
                     if hasattr(self.ui, 'comboFanBottomGraph'):
-                        self.ui.comboFanBottomGraph.currentIndexChanged.connect(lambda: self.refresh_trend_tab('fan_speed'))
+                        self.ui.comboFanBottomGraph.currentIndexChanged.connect(lambda: self._schedule_trend_refresh('fan_speed'))
                     print("✓ Trend dropdown change events connected")
 
                     # MPC tab removed - functionality not needed
@@ -1051,8 +1051,34 @@ class HALogApp:
                         return param_name.split('::')[-1] if '::' in param_name else param_name[:50] + '...'
                     return param_name
 
-            def refresh_trend_tab(self, group_name):
-                """Refresh trend data for specific parameter group with new dropdown structure"""
+            def _schedule_trend_refresh(self, group_name, delay_ms=30):
+                """Queue a trend tab refresh; bursts of requests redraw each group once.
+
+                Repopulating a combo box fires currentIndexChanged for every
+                clear/addItem, so dropdown changes go through a single-shot
+                timer instead of calling refresh_trend_tab directly.
+                """
+                if not hasattr(self, '_trend_refresh_timer'):
+                    self._pending_trend_groups = {}
+                    self._trend_refresh_timer = QtCore.QTimer(self)
+                    self._trend_refresh_timer.setSingleShot(True)
+                    self._trend_refresh_timer.timeout.connect(self._run_pending_trend_refreshes)
+                self._pending_trend_groups[group_name] = None
+                self._trend_refresh_timer.start(delay_ms)
+
+            def _run_pending_trend_refreshes(self):
+                """Refresh every trend group queued by _schedule_trend_refresh"""
+                groups = list(self._pending_trend_groups)
+                self._pending_trend_groups.clear()
+                for group_name in groups:
+                    self.refresh_trend_tab(group_name, skip_if_unchanged=True)
+
+            def refresh_trend_tab(self, group_name, skip_if_unchanged=False):
+                """Refresh trend data for specific parameter group with new dropdown structure
+
+                With skip_if_unchanged, the redraw is skipped when the group's
+                selections, machines and loaded data match its last refresh.
+                """
                 try:
                     # Ensure full data is loaded for trend analysis
                     self._ensure_full_data_loaded()
@@ -1138,6 +1164,19 @@ class HALogApp:
                                       self.machine_manager and 
                                       self.machine_manager.is_multi_machine_selected())
 
+                    # Queued dropdown changes often settle back on what is drawn. The
+                    # entry is popped so a refresh that fails below is never skipped
+                    draw_key = (selected_top_param, selected_bottom_param,
+                                tuple(self.machine_manager.get_selected_machines()) if is_multi_machine else None)
+                    if not hasattr(self, '_trend_draw_state'):
+                        self._trend_draw_state = {}
+                    last_drawn = self._trend_draw_state.pop(group_name, None)
+                    if (skip_if_unchanged and last_drawn is not None
+                            and last_drawn[0] is self.df and last_drawn[1] == draw_key):
+                        self._trend_draw_state[group_name] = last_drawn
+                        print(f"✓ {group_name} trends unchanged - redraw skipped")
+                        return
+
                     if is_multi_machine:
                         # Get color scheme for machines
                         machine_colors = self.machine_manager.get_machine_color_scheme()
@@ -1194,6 +1233,7 @@ class HALogApp:
                         else:
                             PlotUtils._plot_parameter_data_single(graph_bottom, pd.DataFrame(), "Select a parameter from dropdown")
 
+                    self._trend_draw_state[group_name] = (self.df, draw_key)
                     print(f"✓ Successfully refreshed {group_name} trends")
 
                 except Exception as e:
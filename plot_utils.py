@@ -6,6 +6,7 @@ Date: 2025-01-21
 """
 
 # CRITICAL: Import matplotlib without forcing backend - let main.py handle it
+import importlib.util
 import matplotlib
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module='matplotlib')
@@ -14,6 +15,10 @@ warnings.filterwarnings("ignore", category=UserWarning, module='matplotlib')
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
 
 # Conditional Qt imports - safe for headless environments
 def get_canvas_class():
@@ -46,12 +51,62 @@ def get_toolbar_class():
 import pandas as pd
 import numpy as np
 from datetime import timedelta
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
 from typing import Optional, Dict, List
 
+# Optional OpenGL-capable plotting for ThresholdPlotWidgetGL. Only its
+# availability is checked here; the import itself is deferred to the first
+# ThresholdPlotWidgetGL so sessions that never open it don't pay for it.
+PYQTGRAPH_AVAILABLE = importlib.util.find_spec('pyqtgraph') is not None
+pg = None
+
+
+def _load_pyqtgraph():
+    """Import pyqtgraph on first use and keep it as the module-level ``pg``"""
+    global pg
+    if pg is None:
+        import pyqtgraph
+        pg = pyqtgraph
+    return pg
+
 # Set matplotlib style for professional appearance
 plt.style.use('default')
 
+# Consistent colors for parameter groups with enhanced vibrant palette
+GROUP_COLORS = {
+    'Temperature': '#FF6B6B',  # Vibrant Red
+    'Pressure': '#4ECDC4',     # Turquoise 
+    'Flow': '#45B7D1',         # Sky Blue
+    'Level': '#96CEB4',        # Mint Green
+    'Voltage': '#FECA57',      # Sunny Yellow
+    'Current': '#FF9FF3',      # Hot Pink
+    'Humidity': '#54A0FF',     # Electric Blue
+    'Position': '#5F27CD',     # Deep Purple
+    'cpuTemperatureSensor': '#FF4757',  # Bright Red for CPU temps
+    'system_mode': '#2ED573',   # Bright Green for system status
+    'emo_status': '#FFA502',    # Orange for emergency status
+    'motion_enabled': '#3742FA',  # Blue for motion control
+    'odometer_update': '#FF6348', # Coral for odometer events
+    'Other': '#636E72'         # Neutral Gray
+}
+# Line colors for the per-record statistics, shared by every trend plot
+STAT_COLORS = {'avg': '#1976D2', 'min': '#388E3C', 'max': '#D32F2F', 'value': '#1976D2'}
+
+# (lowercase group key, color) pairs, prepared once for title color matching
+_GROUP_COLOR_MATCHERS = tuple((param_type.lower(), color) for param_type, color in GROUP_COLORS.items())
+
+
+def _non_null_values(column: pd.Series):
+    """Return (mask, values) for the non-NaN entries of a statistic column.
+
+    One NumPy pass replaces dropna() plus a label-based .loc lookup of the
+    matching timestamps; apply ``mask`` to any sibling column.
+    """
+    values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    mask = ~np.isnan(values)
+    return mask, values[mask]
+
 
 class InteractivePlotManager:
     """Manages interactive functionality for matplotlib plots"""
@@ -298,12 +353,12 @@ class PlotUtils:
                 legend.set_alpha(0.95)
                 
             # Color-code axis labels based on parameter type
-            colors = PlotUtils.get_group_colors()
             title_color = '#2C3E50'  # Default dark blue
             
             # Match parameter to color scheme
-            for param_type, color in colors.items():
-                if param_type.lower() in parameter_name.lower():
+            parameter_lower = parameter_name.lower()
+            for param_type, color in _GROUP_COLOR_MATCHERS:
+                if param_type in parameter_lower:
                     title_color = color
                     break
                     
@@ -382,22 +437,7 @@ class PlotUtils:
     @staticmethod
     def get_group_colors():
         """Get consistent colors for parameter groups with enhanced vibrant palette"""
-        return {
-            'Temperature': '#FF6B6B',  # Vibrant Red
-            'Pressure': '#4ECDC4',     # Turquoise 
-            'Flow': '#45B7D1',         # Sky Blue
-            'Level': '#96CEB4',        # Mint Green
-            'Voltage': '#FECA57',      # Sunny Yellow
-            'Current': '#FF9FF3',      # Hot Pink
-            'Humidity': '#54A0FF',     # Electric Blue
-            'Position': '#5F27CD',     # Deep Purple
-            'cpuTemperatureSensor': '#FF4757',  # Bright Red for CPU temps
-            'system_mode': '#2ED573',   # Bright Green for system status
-            'emo_status': '#FFA502',    # Orange for emergency status
-            'motion_enabled': '#3742FA',  # Blue for motion control
-            'odometer_update': '#FF6348', # Coral for odometer events
-            'Other': '#636E72'         # Neutral Gray
-        }
+        return dict(GROUP_COLORS)
     
     @staticmethod
     def get_enhanced_color_palette():
@@ -516,9 +556,8 @@ class PlotUtils:
 
             # Process time data
             if 'datetime' in data.columns:
-                data_copy = data.copy()
-                data_copy['datetime'] = pd.to_datetime(data_copy['datetime'])
-                data_copy = data_copy.sort_values('datetime')
+                # assign() + sort_values() build the sorted frame without deep-copying the input first
+                data_copy = data.assign(datetime=pd.to_datetime(data['datetime'])).sort_values('datetime')
                 
                 # Find time clusters for compressed timeline
                 time_clusters = PlotUtils.find_time_clusters(data_copy['datetime'].tolist())
@@ -559,9 +598,7 @@ class PlotUtils:
                     
                 # Process time data
                 if 'datetime' in data.columns:
-                    data_copy = data.copy()
-                    data_copy['datetime'] = pd.to_datetime(data_copy['datetime'])
-                    data_copy = data_copy.sort_values('datetime')
+                    data_copy = data.assign(datetime=pd.to_datetime(data['datetime'])).sort_values('datetime')
                     
                     color = machine_colors.get(machine_id, '#1976D2')
                     
@@ -597,8 +634,6 @@ class PlotUtils:
     @staticmethod
     def _plot_single_parameter_compressed(ax, data, parameter_name, time_clusters):
         """Plot single parameter with compressed timeline"""
-        colors = {'avg': '#1976D2', 'min': '#388E3C', 'max': '#D32F2F'}
-        
         x_positions = []
         labels = []
         
@@ -613,12 +648,12 @@ class PlotUtils:
             # Plot data for this cluster
             for stat in ['avg', 'min', 'max']:
                 if stat in cluster_data.columns:
-                    values = cluster_data[stat].dropna()
-                    if not values.empty:
+                    _, values = _non_null_values(cluster_data[stat])
+                    if values.size:
                         positions = cluster_positions[:len(values)]
                         ax.plot(positions, values, marker='o', markersize=3, 
                                label=stat.upper() if i == 0 else "", 
-                               color=colors.get(stat, '#666666'), 
+                               color=STAT_COLORS.get(stat, '#666666'), 
                                linewidth=2, alpha=0.8)
             
             # Add cluster label
@@ -640,16 +675,14 @@ class PlotUtils:
     @staticmethod
     def _plot_single_parameter_continuous(ax, data, parameter_name):
         """Plot single parameter with continuous timeline"""
-        colors = {'avg': '#1976D2', 'min': '#388E3C', 'max': '#D32F2F'}
-        
         for stat in ['avg', 'min', 'max']:
             if stat in data.columns:
-                values = data[stat].dropna()
-                if not values.empty:
-                    times = data.loc[values.index, 'datetime']
+                mask, values = _non_null_values(data[stat])
+                if values.size:
+                    times = data['datetime'].to_numpy()[mask]
                     ax.plot(times, values, marker='o', markersize=3, 
                            label=stat.upper(), 
-                           color=colors.get(stat, '#666666'), 
+                           color=STAT_COLORS.get(stat, '#666666'), 
                            linewidth=2, alpha=0.8)
         
         # Format x-axis for continuous timeline
@@ -766,11 +799,12 @@ class EnhancedPlotWidget(QWidget):
     def _plot_single_parameter(self, ax, data: pd.DataFrame, parameter: str, title: str):
         """Plot single parameter on given axis"""
         try:
-            # Filter for parameter
+            # Filter for parameter; columns are only replaced below, never edited
+            # in place, so the caller's frame needs no deep copy
             if 'param' in data.columns:
-                param_data = data[data['param'] == parameter].copy()
+                param_data = data[data['param'] == parameter]
             else:
-                param_data = data.copy()
+                param_data = data.copy(deep=False)
             
             if param_data.empty:
                 ax.text(0.5, 0.5, f'No data for {parameter}', 
@@ -785,18 +819,17 @@ class EnhancedPlotWidget(QWidget):
                 param_data = param_data.sort_values('datetime')
             
             # Plot with professional styling
-            colors = {'avg': '#1976D2', 'min': '#388E3C', 'max': '#D32F2F'}
             line_styles = {'avg': '-', 'min': '--', 'max': '--'}
             
             plotted_any = False
             
             for stat in ['avg', 'min', 'max']:
                 if stat in param_data.columns and not param_data[stat].isna().all():
-                    values = param_data[stat].dropna()
-                    if not values.empty:
-                        ax.plot(param_data.loc[values.index, 'datetime'], values,
+                    mask, values = _non_null_values(param_data[stat])
+                    if values.size:
+                        ax.plot(param_data['datetime'].to_numpy()[mask], values,
                                marker='o', markersize=3, label=f'{stat.upper()}',
-                               color=colors.get(stat, '#666666'),
+                               color=STAT_COLORS.get(stat, '#666666'),
                                linestyle=line_styles.get(stat, '-'),
                                linewidth=2, alpha=0.8)
                         plotted_any = True
@@ -890,12 +923,11 @@ class EnhancedDualPlotWidget(QWidget):
         try:
             # Filter for parameter using PlotUtils logic
             if 'param' in data.columns:
-                param_data = data[data['param'] == parameter].copy()
+                param_data = data[data['param'] == parameter]
             else:
                 # Look for parameter in column names
                 if parameter in data.columns:
-                    param_data = data.copy()
-                    param_data['value'] = data[parameter]
+                    param_data = data.assign(value=data[parameter])
                 else:
                     param_data = pd.DataFrame()
             
@@ -932,8 +964,7 @@ class EnhancedDualPlotWidget(QWidget):
     
     def _plot_compressed_timeline(self, ax, data, parameter, time_clusters):
         """Plot with compressed timeline for multiple date ranges"""
-        colors = PlotUtils.get_group_colors()
-        default_color = colors.get('Other', '#1976D2')
+        default_color = GROUP_COLORS.get('Other', '#1976D2')
         
         x_positions = []
         labels = []
@@ -948,8 +979,8 @@ class EnhancedDualPlotWidget(QWidget):
             # Plot statistics
             for stat in ['avg', 'min', 'max', 'value']:
                 if stat in cluster_data.columns:
-                    values = cluster_data[stat].dropna()
-                    if not values.empty:
+                    _, values = _non_null_values(cluster_data[stat])
+                    if values.size:
                         positions = cluster_positions[:len(values)]
                         ax.plot(positions, values, marker='o', markersize=3, 
                                label=stat.upper() if i == 0 else "", 
@@ -975,17 +1006,15 @@ class EnhancedDualPlotWidget(QWidget):
     
     def _plot_continuous_timeline(self, ax, data, parameter):
         """Plot with continuous timeline for single date range"""
-        colors = {'avg': '#1976D2', 'min': '#388E3C', 'max': '#D32F2F', 'value': '#1976D2'}
-        
         plotted = False
         for stat in ['avg', 'min', 'max', 'value']:
             if stat in data.columns:
-                values = data[stat].dropna()
-                if not values.empty:
-                    times = data.loc[values.index, 'datetime']
+                mask, values = _non_null_values(data[stat])
+                if values.size:
+                    times = data['datetime'].to_numpy()[mask]
                     ax.plot(times, values, marker='o', markersize=3, 
                            label=stat.upper(),
-                           color=colors.get(stat, '#1976D2'), 
+                           color=STAT_COLORS.get(stat, '#1976D2'), 
                            linewidth=2, alpha=0.8)
                     plotted = True
         
@@ -1010,67 +1039,374 @@ PlotWidget = EnhancedPlotWidget
 DualPlotWidget = EnhancedDualPlotWidget
 
 
-class ThresholdPlotWidget(EnhancedPlotWidget):
-    """Advanced threshold visualization widget with min/max boundaries and alert zones"""
+class ThresholdAnalysisMixin:
+    """Threshold state, detection and violation masks shared by the threshold widgets.
+
+    Hosts call _init_threshold_state() from __init__ and draw the cache entry
+    returned by _prepare_parameter(); only the drawing differs per backend.
+    """
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
+    _STATUS_COLORS = ('green', 'orange', 'red')  # indexed by threshold status label
+    
+    def _init_threshold_state(self):
+        """Create the per-parameter threshold and cache dictionaries"""
         self.thresholds = {}  # Store threshold data per parameter
         self.alert_zones = {}  # Store alert zone configurations
+        self._auto_threshold_fingerprints = {}  # parameter -> fingerprint of data its thresholds were detected from
+        self._threshold_bounds = {}  # parameter -> packed [min, max, warning_min, warning_max] array
+        self._param_cache = {}  # parameter -> prepared rows, finite x/y arrays, fingerprint and masks
+        self._drawn = None  # identity of the plot currently shown, set by the host widget
+        
+    def _clear_threshold_state(self):
+        """Forget all thresholds and prepared data"""
+        self.thresholds.clear()
+        self.alert_zones.clear()
+        self._auto_threshold_fingerprints.clear()
+        self._threshold_bounds.clear()
+        self._param_cache.clear()
+        self._drawn = None
+        
+    def invalidate_cache(self, parameter: str = None):
+        """Drop prepared plot data (all parameters by default).
+
+        Redraws of the same DataFrame object reuse the filtered rows and
+        violation masks while its fingerprint (row count, first/last datetime
+        and value sum) is unchanged; call this after an in-place edit that
+        keeps all of those, such as swapping two values.
+        """
+        self._drawn = None
+        if parameter is None:
+            self._param_cache.clear()
+        else:
+            self._param_cache.pop(parameter, None)
         
     def set_parameter_thresholds(self, parameter: str, min_threshold: float = None, 
                                 max_threshold: float = None, warning_min: float = None, 
                                 warning_max: float = None):
         """Set threshold boundaries for a parameter"""
+        # Explicitly set thresholds are never replaced by auto-detection
+        self._auto_threshold_fingerprints.pop(parameter, None)
         self.thresholds[parameter] = {
             'min': min_threshold,
             'max': max_threshold, 
             'warning_min': warning_min,
             'warning_max': warning_max
         }
+        # Pack once so violation scans compare against plain floats (unset -> +/-inf)
+        self._threshold_bounds[parameter] = np.array([
+            -np.inf if min_threshold is None else min_threshold,
+            np.inf if max_threshold is None else max_threshold,
+            -np.inf if warning_min is None else warning_min,
+            np.inf if warning_max is None else warning_max,
+        ], dtype=float)
+        
+    def _prepare_parameter(self, data: pd.DataFrame, parameter: str, auto_detect_thresholds: bool = True,
+                           source_fingerprint: tuple = None):
+        """Return the cache entry for ``parameter`` with thresholds and masks up to date.
+
+        ``source_fingerprint`` is _data_fingerprint(data) when the caller has
+        already computed it. Returns None when ``data`` has no rows for the
+        parameter.
+        """
+        if source_fingerprint is None:
+            source_fingerprint = self._data_fingerprint(data)
+            
+        # Redrawing the same, unedited frame reuses the filtered, sorted rows
+        cache = self._param_cache.get(parameter)
+        if (cache is None or cache['source'] is not data
+                or cache['source_fingerprint'] != source_fingerprint):
+            # Filter data for the parameter; the caller's frame is only read and
+            # sort_values() returns a new frame, so no copy is taken
+            if 'param' in data.columns:
+                param_data = data[data['param'] == parameter]
+            else:
+                param_data = data
+                
+            if param_data.empty:
+                return None
+                
+            # Sort by datetime for proper line plotting
+            param_data = param_data.sort_values('datetime')
+            cache = self._prepare_arrays(param_data)
+            cache['source'] = data
+            cache['source_fingerprint'] = source_fingerprint
+            self._param_cache[parameter] = cache
+            
+        # Auto-detect thresholds if enabled and not manually set; reuse the
+        # previous detection while the underlying data is unchanged
+        if auto_detect_thresholds:
+            fingerprint = cache['fingerprint']
+            if parameter not in self.thresholds or (
+                    parameter in self._auto_threshold_fingerprints and
+                    self._auto_threshold_fingerprints[parameter] != fingerprint):
+                self._auto_detect_thresholds(cache['y'], parameter)
+                if parameter in self.thresholds:
+                    self._auto_threshold_fingerprints[parameter] = fingerprint
+                    
+        # Violation masks are computed once and shared by the colored line
+        # and the alert markers; they stay valid until the bounds change
+        bounds = self._threshold_bounds.get(parameter)
+        if cache['bounds'] is not bounds:
+            cache['bounds'] = bounds
+            cache['masks'] = None if bounds is None else self._get_violation_masks(cache['y'], bounds)
+        return cache
+        
+    def _emit_threshold_violations(self, parameter: str, cache: dict):
+        """Emit threshold_violations once with all violating rows of the parameter.
+
+        Skipped when nothing is connected, so plotting never pays for the
+        row selection unless a receiver wants it.
+        """
+        if cache['masks'] is None or not self.receivers(self.threshold_violations):
+            return
+        critical_mask, warning_mask = cache['masks']
+        if critical_mask.any() or warning_mask.any():
+            rows = cache['param_data'][cache['finite']]
+            self.threshold_violations.emit(parameter, rows[critical_mask], rows[warning_mask])
+        
+    def _line_points(self, cache: dict, target: int):
+        """Return (x, y_display, masks) for the drawn line, decimated to ``target`` points.
+
+        Violations were found on the full series, so alert markers should
+        keep using the cache arrays.
+        """
+        x_values, y_display, masks = cache['x'], cache['y_display'], cache['masks']
+        if len(x_values) <= target or x_values.dtype.kind not in 'Mif':
+            return x_values, y_display, masks
+        x_numeric = x_values.view(np.int64) if x_values.dtype.kind == 'M' else x_values
+        keep = self._downsample_lttb(x_numeric, cache['y'], target)
+        if masks is not None:
+            masks = (masks[0][keep], masks[1][keep])
+        return x_values[keep], y_display[keep], masks
+        
+    @staticmethod
+    def _data_fingerprint(param_data: pd.DataFrame) -> tuple:
+        """Cheap identity for plot data: size, first/last datetime and value sum"""
+        values = param_data['avg'] if 'avg' in param_data.columns else param_data['average']
+        times = param_data['datetime']
+        return (len(param_data), times.iloc[0], times.iloc[-1], float(values.sum()))
+        
+    @classmethod
+    def _prepare_arrays(cls, param_data: pd.DataFrame) -> dict:
+        """Extract the plotted columns once as arrays, keeping only finite values.
+
+        Returns a cache entry with the sorted rows, the finite mask over them
+        and the matching ``x`` (datetime64) and ``y`` (float64) arrays. Threshold
+        statistics and violation masks use ``y``; the drawn line and markers
+        use the float32 ``y_display`` copy, which is plenty for screen output.
+        """
+        values = param_data['avg'] if 'avg' in param_data.columns else param_data['average']
+        y_all = values.to_numpy(dtype=np.float64)
+        finite = np.isfinite(y_all)
+        y = y_all[finite]
+        return {
+            'param_data': param_data,
+            'finite': finite,
+            'x': param_data['datetime'].to_numpy()[finite],
+            'y': y,
+            'y_display': y.astype(np.float32),
+            'fingerprint': cls._data_fingerprint(param_data),
+            'bounds': None,
+            'masks': None,
+        }
+            
+    @staticmethod
+    def _downsample_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """Pick ``n_out`` indices with Largest-Triangle-Three-Buckets.
+
+        The first and last points are kept; every bucket in between contributes
+        the point forming the largest triangle with the previously chosen point
+        and the next bucket's mean, which preserves spikes.
+        """
+        n = len(y)
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+            
+        x = x.astype(np.float64)
+        # Bucket b covers [edges[b], edges[b + 1]) over the interior points
+        edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+        edges[-1] = n - 1
+        counts = np.diff(edges)
+        mean_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+        mean_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+        # The last bucket looks ahead to the final point
+        mean_x = np.append(mean_x[1:], x[-1])
+        mean_y = np.append(mean_y[1:], y[-1])
+        
+        keep = np.empty(n_out, dtype=np.int64)
+        keep[0], keep[-1] = 0, n - 1
+        a = 0
+        for b in range(n_out - 2):
+            start, end = edges[b], edges[b + 1]
+            ax_, ay = x[a], y[a]
+            areas = np.abs((ax_ - mean_x[b]) * (y[start:end] - ay) -
+                           (ax_ - x[start:end]) * (mean_y[b] - ay))
+            a = start + int(np.argmax(areas))
+            keep[b + 1] = a
+        return keep
+            
+    def _auto_detect_thresholds(self, values: np.ndarray, parameter: str):
+        """Automatically detect reasonable threshold values from finite data values"""
+        try:
+            if len(values) == 0:
+                return
+                
+            # Statistical analysis for threshold detection (both quartiles in one pass)
+            q1, q3 = np.quantile(values, [0.25, 0.75])
+            iqr = q3 - q1
+            
+            # Use interquartile range method for robust threshold detection
+            warning_min = q1 - (1.5 * iqr)
+            warning_max = q3 + (1.5 * iqr)
+            critical_min = q1 - (3 * iqr)  
+            critical_max = q3 + (3 * iqr)
+            
+            # Ensure thresholds make sense (don't allow negative for certain parameters)
+            if any(keyword in parameter.lower() for keyword in ['temp', 'flow', 'speed', 'voltage']):
+                critical_min = max(0, critical_min)
+                warning_min = max(0, warning_min)
+                
+            self.set_parameter_thresholds(
+                parameter,
+                min_threshold=critical_min,
+                max_threshold=critical_max,
+                warning_min=warning_min,
+                warning_max=warning_max
+            )
+            
+        except Exception as e:
+            print(f"Error auto-detecting thresholds: {e}")
+            
+    @classmethod
+    def _classify_threshold_status(cls, values: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+        """Label each value 0 (normal), 1 (warning) or 2 (critical) in one vectorized pass"""
+        return cls._status_from_masks(*cls._get_violation_masks(values, bounds))
+        
+    @staticmethod
+    def _status_from_masks(critical_mask: np.ndarray, warning_mask: np.ndarray) -> np.ndarray:
+        """Combine violation masks into 0 (normal), 1 (warning), 2 (critical) labels"""
+        status = warning_mask.astype(np.int8)
+        status[critical_mask] = 2
+        return status
+        
+    def _get_threshold_color(self, value: float, thresholds: dict) -> str:
+        """Determine color based on threshold status"""
+        warning_min = thresholds.get('warning_min')
+        warning_max = thresholds.get('warning_max')
+        critical_min = thresholds.get('min')
+        critical_max = thresholds.get('max')
+        
+        # Check critical thresholds first
+        if critical_min is not None and value < critical_min:
+            return 'red'
+        if critical_max is not None and value > critical_max:
+            return 'red'
+            
+        # Check warning thresholds
+        if warning_min is not None and value < warning_min:
+            return 'orange'
+        if warning_max is not None and value > warning_max:
+            return 'orange'
+            
+        return 'green'  # Normal range
+        
+    @staticmethod
+    def _get_violation_masks(values: np.ndarray, bounds: np.ndarray):
+        """Return (critical, warning) boolean masks; warning excludes critical points"""
+        critical_min, critical_max, warning_min, warning_max = bounds
+        # Fused in place through one scratch buffer: three boolean arrays
+        # instead of seven temporaries per scan
+        scratch = np.empty(values.shape, dtype=bool)
+        critical_mask = np.less(values, critical_min)
+        critical_mask |= np.greater(values, critical_max, out=scratch)
+        warning_mask = np.less(values, warning_min)
+        warning_mask |= np.greater(values, warning_max, out=scratch)
+        warning_mask &= np.logical_not(critical_mask, out=scratch)
+        return critical_mask, warning_mask
+            
+    def get_threshold_summary(self, parameter: str) -> dict:
+        """Get summary of threshold status for a parameter"""
+        try:
+            thresholds = self.thresholds.get(parameter, {})
+            return {
+                'parameter': parameter,
+                'has_thresholds': bool(thresholds),
+                'thresholds': thresholds,
+                'status': 'configured' if thresholds else 'not_configured'
+            }
+        except Exception as e:
+            print(f"Error getting threshold summary: {e}")
+            return {'parameter': parameter, 'status': 'error'}
+
+
+class ThresholdPlotWidget(ThresholdAnalysisMixin, EnhancedPlotWidget):
+    """Advanced threshold visualization widget with min/max boundaries and alert zones"""
+    
+    # One batch per plotted parameter: name, critical rows, warning rows (DataFrames)
+    threshold_violations = pyqtSignal(str, object, object)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._init_threshold_state()
+        
+    def reset(self):
+        """Clear thresholds and the current plot so the widget can be reused for new data"""
+        self._clear_threshold_state()
+        self.data = pd.DataFrame()
+        if self.figure is not None:
+            self.figure.clear()
+            self.canvas.draw()
         
     def plot_parameter_with_thresholds(self, data: pd.DataFrame, parameter: str, 
                                      title: str = "", auto_detect_thresholds: bool = True):
-        """Plot parameter with threshold boundaries and alert zones"""
+        """Plot parameter with threshold boundaries and alert zones.
+
+        Replotting the same DataFrame with the same arguments and thresholds
+        is a no-op while the frame's fingerprint (row count, first/last
+        datetime and value sum) is unchanged; see invalidate_cache().
+        """
         try:
             if data.empty or self.figure is None:
                 return
                 
+            # Nothing to do if this exact plot is already on the canvas; the
+            # full clear-and-redraw re-renders every threshold band and line.
+            # The fingerprint catches in-place edits of the same frame.
+            source_fingerprint = self._data_fingerprint(data)
+            drawn = self._drawn
+            if (drawn is not None and drawn[0] is data
+                    and drawn[1:5] == (source_fingerprint, parameter, title, auto_detect_thresholds)
+                    and drawn[5] is self._threshold_bounds.get(parameter)
+                    and drawn[6] in self.figure.axes):
+                return
+            self._drawn = None
+                
             self.figure.clear()
             ax = self.figure.add_subplot(111)
             
-            # Filter data for the parameter
-            if 'param' in data.columns:
-                param_data = data[data['param'] == parameter].copy()
-            else:
-                param_data = data.copy()
-                
-            if param_data.empty:
+            cache = self._prepare_parameter(data, parameter, auto_detect_thresholds, source_fingerprint)
+            if cache is None:
                 ax.text(0.5, 0.5, f'No data available for {parameter}', 
                        ha='center', va='center', transform=ax.transAxes, fontsize=12)
                 self.canvas.draw()
                 return
-                
-            # Sort by datetime for proper line plotting
-            param_data = param_data.sort_values('datetime')
+            param_data = cache['param_data']
+            x_values, y_display, masks = cache['x'], cache['y_display'], cache['masks']
             
-            # Auto-detect thresholds if enabled and not manually set
-            if auto_detect_thresholds and parameter not in self.thresholds:
-                self._auto_detect_thresholds(param_data, parameter)
-                
-            # Plot the main parameter line
-            x_data = param_data['datetime']
-            y_data = param_data['avg'] if 'avg' in param_data.columns else param_data['average']
+            # Decimate the drawn line to about two points per pixel
+            line_x, line_y, line_masks = self._line_points(cache, int(self.figure.bbox.width * 2))
             
             # Color-code the line based on threshold status
-            self._plot_threshold_colored_line(ax, x_data, y_data, parameter)
+            self._plot_threshold_colored_line(ax, line_x, line_y, parameter, line_masks)
             
-            # Add threshold bands and lines
-            self._add_threshold_visualization(ax, x_data, parameter)
+            # Add threshold bands and lines; their legend entries follow the
+            # line status entries as before
+            n_status_handles = len(ax.get_legend_handles_labels()[0])
+            threshold_handles = self._add_threshold_visualization(ax, parameter)
             
             # Add statistical bounds if available
             if 'min' in param_data.columns and 'max' in param_data.columns:
-                ax.fill_between(x_data, param_data['min'], param_data['max'], 
+                ax.fill_between(param_data['datetime'], param_data['min'], param_data['max'], 
                               alpha=0.1, color='blue', label='Min/Max Range')
                               
             # Configure the plot
@@ -1078,17 +1414,22 @@ class ThresholdPlotWidget(EnhancedPlotWidget):
             ax.set_xlabel('Time', fontweight='bold')
             ax.set_ylabel('Value', fontweight='bold')
             ax.grid(True, alpha=0.3)
-            ax.legend(loc='upper right', framealpha=0.9)
+            handles = ax.get_legend_handles_labels()[0]
+            handles[n_status_handles:n_status_handles] = threshold_handles
+            ax.legend(handles=handles, loc='upper right', framealpha=0.9)
             
             # Format time axis
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d %H:%M'))
             self.figure.autofmt_xdate()
             
             # Add alert zone indicators
-            self._add_alert_indicators(ax, param_data, parameter)
+            self._add_alert_indicators(ax, x_values, y_display, parameter, masks)
             
             self.figure.tight_layout()
             self.canvas.draw()
+            self._drawn = (data, source_fingerprint, parameter, title, auto_detect_thresholds,
+                           self._threshold_bounds.get(parameter), ax)
+            self._emit_threshold_violations(parameter, cache)
             
             # Add interactive capabilities
             if hasattr(self, 'interactive_manager'):
@@ -1097,43 +1438,12 @@ class ThresholdPlotWidget(EnhancedPlotWidget):
         except Exception as e:
             print(f"Error plotting threshold visualization: {e}")
             
-    def _auto_detect_thresholds(self, param_data: pd.DataFrame, parameter: str):
-        """Automatically detect reasonable threshold values based on data statistics"""
-        try:
-            values = param_data['avg'] if 'avg' in param_data.columns else param_data['average']
-            
-            # Statistical analysis for threshold detection
-            mean_val = values.mean()
-            std_val = values.std()
-            median_val = values.median()
-            q1 = values.quantile(0.25)
-            q3 = values.quantile(0.75)
-            iqr = q3 - q1
-            
-            # Use interquartile range method for robust threshold detection
-            warning_min = q1 - (1.5 * iqr)
-            warning_max = q3 + (1.5 * iqr)
-            critical_min = q1 - (3 * iqr)  
-            critical_max = q3 + (3 * iqr)
-            
-            # Ensure thresholds make sense (don't allow negative for certain parameters)
-            if any(keyword in parameter.lower() for keyword in ['temp', 'flow', 'speed', 'voltage']):
-                critical_min = max(0, critical_min)
-                warning_min = max(0, warning_min)
-                
-            self.set_parameter_thresholds(
-                parameter,
-                min_threshold=critical_min,
-                max_threshold=critical_max,
-                warning_min=warning_min,
-                warning_max=warning_max
-            )
-            
-        except Exception as e:
-            print(f"Error auto-detecting thresholds: {e}")
-            
-    def _plot_threshold_colored_line(self, ax, x_data, y_data, parameter: str):
-        """Plot line with colors based on threshold status"""
+    def _plot_threshold_colored_line(self, ax, x_data, y_data, parameter: str, masks=None):
+        """Plot line with colors based on threshold status
+
+        ``x_data``/``y_data`` may be Series or arrays; ``masks`` is an optional
+        precomputed (critical, warning) pair from _get_violation_masks for ``y_data``.
+        """
         try:
             thresholds = self.thresholds.get(parameter, {})
             
@@ -1142,30 +1452,37 @@ class ThresholdPlotWidget(EnhancedPlotWidget):
                 ax.plot(x_data, y_data, linewidth=2, alpha=0.8, label=parameter)
                 return
                 
-            # Create segments based on threshold status
-            segments = []
-            colors = []
-            
-            for i in range(len(y_data)):
-                value = y_data.iloc[i]
-                color = self._get_threshold_color(value, thresholds)
-                
-                if i == 0:
-                    segments.append(([x_data.iloc[i]], [value]))
-                    colors.append(color)
-                else:
-                    # Extend current segment or start new one
-                    if colors[-1] == color:
-                        segments[-1][0].append(x_data.iloc[i])
-                        segments[-1][1].append(value)
-                    else:
-                        segments.append(([x_data.iloc[i-1], x_data.iloc[i]], [y_data.iloc[i-1], value]))
-                        colors.append(color)
-                        
-            # Plot each segment with its color
-            for segment, color in zip(segments, colors):
-                if len(segment[0]) > 1:
-                    ax.plot(segment[0], segment[1], color=color, linewidth=2, alpha=0.8)
+            # Label every point once (0 normal, 1 warning, 2 critical), then split
+            # the line wherever the label changes
+            x_values = np.asarray(x_data)
+            y_values = np.asarray(y_data)
+            if y_values.dtype.kind != 'f':
+                y_values = y_values.astype(float)
+            if masks is not None:
+                status = self._status_from_masks(*masks)
+            else:
+                status = self._classify_threshold_status(y_values, self._threshold_bounds[parameter])
+            
+            change_points = np.flatnonzero(status[1:] != status[:-1]) + 1
+            starts = np.concatenate(([0], change_points))
+            ends = np.concatenate((change_points, [len(status)]))
+            
+            # Collect every segment into one LineCollection instead of one
+            # Line2D per segment; later segments start at the previous point so
+            # the line stays continuous
+            if x_values.dtype.kind == 'M':
+                ax.xaxis_date()
+                x_numeric = mdates.date2num(x_values)
+            else:
+                x_numeric = x_values.astype(float)
+            points = np.column_stack((x_numeric, y_values))
+            firsts = np.maximum(starts - 1, 0)
+            drawn = ends - firsts > 1
+            segments = [points[first:end] for first, end in zip(firsts[drawn], ends[drawn])]
+            if segments:
+                colors = [self._STATUS_COLORS[label] for label in status[starts[drawn]]]
+                ax.add_collection(LineCollection(segments, colors=colors, linewidths=2, alpha=0.8))
+                ax.autoscale_view()
                     
             # Add legend for threshold status
             ax.plot([], [], color='green', linewidth=2, label='Normal')
@@ -1177,126 +1494,253 @@ class ThresholdPlotWidget(EnhancedPlotWidget):
             # Fallback to simple line
             ax.plot(x_data, y_data, linewidth=2, alpha=0.8, label=parameter)
             
-    def _get_threshold_color(self, value: float, thresholds: dict) -> str:
-        """Determine color based on threshold status"""
-        warning_min = thresholds.get('warning_min')
-        warning_max = thresholds.get('warning_max')
-        critical_min = thresholds.get('min')
-        critical_max = thresholds.get('max')
-        
-        # Check critical thresholds first
-        if critical_min is not None and value < critical_min:
-            return 'red'
-        if critical_max is not None and value > critical_max:
-            return 'red'
-            
-        # Check warning thresholds
-        if warning_min is not None and value < warning_min:
-            return 'orange'
-        if warning_max is not None and value > warning_max:
-            return 'orange'
-            
-        return 'green'  # Normal range
-        
-    def _add_threshold_visualization(self, ax, x_data, parameter: str):
-        """Add threshold lines and bands to the plot"""
+    # (threshold key, legend label, color, linestyle, linewidth) for the boundary lines
+    _THRESHOLD_LINES = (
+        ('min', 'Critical Min', 'red', '--', 2),
+        ('max', 'Critical Max', 'red', '--', 2),
+        ('warning_min', 'Warning Min', 'orange', ':', 1.5),
+        ('warning_max', 'Warning Max', 'orange', ':', 1.5),
+    )
+    # (lower key, upper key, legend label, color, alpha) for the shaded bands
+    _THRESHOLD_BANDS = (
+        ('min', 'warning_min', 'Critical Zone (Low)', 'red', 0.1),
+        ('warning_max', 'max', 'Critical Zone (High)', 'red', 0.1),
+        ('warning_min', 'warning_max', 'Normal Operating Range', 'green', 0.05),
+    )
+    
+    def _add_threshold_visualization(self, ax, parameter: str) -> list:
+        """Add threshold lines and bands to the plot as two collections.
+
+        Lines and bands span the full axes width (x in axes coordinates), so
+        no x extent or axes-limit query is needed. Returns legend proxy
+        handles for them, since collections carry a single label.
+        """
         try:
             thresholds = self.thresholds.get(parameter, {})
             if not thresholds:
-                return
+                return []
                 
-            x_min, x_max = ax.get_xlim() if hasattr(ax, 'get_xlim') else (x_data.min(), x_data.max())
-            
-            # Add critical threshold lines
-            if thresholds.get('min') is not None:
-                ax.axhline(y=thresholds['min'], color='red', linestyle='--', linewidth=2, 
-                          alpha=0.7, label='Critical Min')
-            if thresholds.get('max') is not None:
-                ax.axhline(y=thresholds['max'], color='red', linestyle='--', linewidth=2, 
-                          alpha=0.7, label='Critical Max')
-                          
-            # Add warning threshold lines
-            if thresholds.get('warning_min') is not None:
-                ax.axhline(y=thresholds['warning_min'], color='orange', linestyle=':', linewidth=1.5, 
-                          alpha=0.7, label='Warning Min')
-            if thresholds.get('warning_max') is not None:
-                ax.axhline(y=thresholds['warning_max'], color='orange', linestyle=':', linewidth=1.5, 
-                          alpha=0.7, label='Warning Max')
-                          
-            # Add threshold bands
-            if thresholds.get('warning_min') is not None and thresholds.get('min') is not None:
-                ax.fill_between([x_min, x_max], [thresholds['min']] * 2, [thresholds['warning_min']] * 2,
-                              alpha=0.1, color='red', label='Critical Zone (Low)')
-                              
-            if thresholds.get('warning_max') is not None and thresholds.get('max') is not None:
-                ax.fill_between([x_min, x_max], [thresholds['warning_max']] * 2, [thresholds['max']] * 2,
-                              alpha=0.1, color='red', label='Critical Zone (High)')
-                              
-            # Add normal operating band
-            if thresholds.get('warning_min') is not None and thresholds.get('warning_max') is not None:
-                ax.fill_between([x_min, x_max], [thresholds['warning_min']] * 2, [thresholds['warning_max']] * 2,
-                              alpha=0.05, color='green', label='Normal Operating Range')
-                              
+            span = ax.get_yaxis_transform()
+            line_handles, band_handles = [], []
+            segments, colors, styles, widths = [], [], [], []
+            for key, label, color, style, width in self._THRESHOLD_LINES:
+                value = thresholds.get(key)
+                if value is not None:
+                    segments.append(((0, value), (1, value)))
+                    colors.append(color)
+                    styles.append(style)
+                    widths.append(width)
+                    line_handles.append(Line2D([], [], color=color, linestyle=style, linewidth=width,
+                                               alpha=0.7, label=label))
+            if segments:
+                ax.add_collection(LineCollection(segments, colors=colors, linestyles=styles,
+                                                 linewidths=widths, alpha=0.7, transform=span),
+                                  autolim=False)
+                                  
+            bands, facecolors = [], []
+            for low_key, high_key, label, color, alpha in self._THRESHOLD_BANDS:
+                low, high = thresholds.get(low_key), thresholds.get(high_key)
+                if low is not None and high is not None:
+                    bands.append(((0, low), (1, low), (1, high), (0, high)))
+                    facecolors.append(to_rgba(color, alpha))
+                    band_handles.append(Patch(facecolor=to_rgba(color, alpha), label=label))
+            if bands:
+                ax.add_collection(PolyCollection(bands, facecolors=facecolors, edgecolors='none',
+                                                 transform=span), autolim=False)
+                                                 
+            # Keep the threshold values inside the autoscaled y range, like axhline
+            levels = [value for value in thresholds.values() if value is not None]
+            if levels:
+                ax.dataLim.update_from_data_xy(np.column_stack((np.zeros(len(levels)), levels)),
+                                               ignore=False, updatex=False)
+                ax.autoscale_view()
+            return line_handles + band_handles
+            
         except Exception as e:
             print(f"Error adding threshold visualization: {e}")
+            return []
             
-    def _add_alert_indicators(self, ax, param_data: pd.DataFrame, parameter: str):
+    def _add_alert_indicators(self, ax, x_values: np.ndarray, y_values: np.ndarray,
+                              parameter: str, masks=None):
         """Add visual alert indicators for threshold violations"""
         try:
             thresholds = self.thresholds.get(parameter, {})
             if not thresholds:
                 return
                 
-            y_data = param_data['avg'] if 'avg' in param_data.columns else param_data['average']
-            x_data = param_data['datetime']
             
-            # Find threshold violations
-            violations = []
-            for i, (x, y) in enumerate(zip(x_data, y_data)):
-                violation_type = None
-                
-                # Check for critical violations
-                if (thresholds.get('min') is not None and y < thresholds['min']) or \
-                   (thresholds.get('max') is not None and y > thresholds['max']):
-                    violation_type = 'critical'
-                # Check for warning violations
-                elif (thresholds.get('warning_min') is not None and y < thresholds['warning_min']) or \
-                     (thresholds.get('warning_max') is not None and y > thresholds['warning_max']):
-                    violation_type = 'warning'
-                    
-                if violation_type:
-                    violations.append((x, y, violation_type))
-                    
-            # Plot violation markers
-            if violations:
-                critical_x = [v[0] for v in violations if v[2] == 'critical']
-                critical_y = [v[1] for v in violations if v[2] == 'critical']
-                warning_x = [v[0] for v in violations if v[2] == 'warning']
-                warning_y = [v[1] for v in violations if v[2] == 'warning']
-                
-                if critical_x:
-                    ax.scatter(critical_x, critical_y, color='red', s=50, marker='X', 
-                             alpha=0.8, label='Critical Alerts', zorder=5)
-                if warning_x:
-                    ax.scatter(warning_x, warning_y, color='orange', s=30, marker='!', 
-                             alpha=0.8, label='Warning Alerts', zorder=5)
+            # Find threshold violations with boolean masks instead of a per-point loop
+            if masks is None:
+                masks = self._get_violation_masks(y_values, self._threshold_bounds[parameter])
+            critical_mask, warning_mask = masks
+            
+            # Plot all violation markers as one collection; critical points are
+            # red and larger, warning points orange (the masks are disjoint)
+            alert_mask = critical_mask | warning_mask
+            if alert_mask.any():
+                is_critical = critical_mask[alert_mask]
+                colors = np.where(is_critical[:, None], to_rgba('red', 0.8), to_rgba('orange', 0.8))
+                ax.scatter(x_values[alert_mask], y_values[alert_mask], c=colors,
+                         s=np.where(is_critical, 50, 30), marker='X', label='Threshold Alerts', zorder=5)
                              
         except Exception as e:
             print(f"Error adding alert indicators: {e}")
+
+
+class ThresholdPlotWidgetGL(ThresholdAnalysisMixin, QWidget):
+    """pyqtgraph version of ThresholdPlotWidget for fast pan/zoom on long traces.
+
+    Shares threshold detection, caching and violation masks with
+    ThresholdPlotWidget; only the drawing goes through pyqtgraph items, which
+    render with OpenGL when pyqtgraph is configured with useOpenGL=True.
+    """
+    
+    _STATUS_NAMES = ('Normal', 'Warning', 'Critical')
+    
+    # One batch per plotted parameter: name, critical rows, warning rows (DataFrames)
+    threshold_violations = pyqtSignal(str, object, object)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._init_threshold_state()
+        self.layout = QVBoxLayout(self)
+        self.setMinimumHeight(300)
+        self.plot_widget = None
+        
+        if PYQTGRAPH_AVAILABLE:
+            try:
+                _load_pyqtgraph()
+            except ImportError as e:
+                print(f"⚠️ pyqtgraph could not be imported: {e}")
+        if pg is None:
+            error_label = QLabel("pyqtgraph is not installed - threshold plotting is unavailable.")
+            error_label.setStyleSheet("color: red; padding: 10px; background: #fff3cd; border: 1px solid #ffeaa7;")
+            self.layout.addWidget(error_label)
+            return
             
-    def get_threshold_summary(self, parameter: str) -> dict:
-        """Get summary of threshold status for a parameter"""
+        self.plot_widget = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem()})
+        self.plot_widget.setBackground('w')
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
+        self.plot_widget.setLabel('bottom', 'Time')
+        self.plot_widget.setLabel('left', 'Value')
+        self.layout.addWidget(self.plot_widget)
+        
+    def reset(self):
+        """Clear thresholds and the current plot so the widget can be reused for new data"""
+        self._clear_threshold_state()
+        if self.plot_widget is not None:
+            self.plot_widget.clear()
+            
+    def plot_parameter_with_thresholds(self, data: pd.DataFrame, parameter: str, 
+                                     title: str = "", auto_detect_thresholds: bool = True):
+        """Plot parameter with threshold boundaries and alert zones.
+
+        Replotting the same DataFrame with the same arguments and thresholds
+        is a no-op while the frame's fingerprint (row count, first/last
+        datetime and value sum) is unchanged; see invalidate_cache().
+        """
         try:
-            thresholds = self.thresholds.get(parameter, {})
-            return {
-                'parameter': parameter,
-                'has_thresholds': bool(thresholds),
-                'thresholds': thresholds,
-                'status': 'configured' if thresholds else 'not_configured'
-            }
+            if data.empty or self.plot_widget is None:
+                return
+                
+            source_fingerprint = self._data_fingerprint(data)
+            drawn = self._drawn
+            if (drawn is not None and drawn[0] is data
+                    and drawn[1:5] == (source_fingerprint, parameter, title, auto_detect_thresholds)
+                    and drawn[5] is self._threshold_bounds.get(parameter)):
+                return
+            self._drawn = None
+            
+            plot = self.plot_widget
+            plot.clear()
+            if plot.plotItem.legend is not None:
+                plot.plotItem.legend.clear()
+            else:
+                plot.addLegend(offset=(-10, 10))
+                
+            cache = self._prepare_parameter(data, parameter, auto_detect_thresholds, source_fingerprint)
+            if cache is None:
+                plot.setTitle(f'No data available for {parameter}')
+                return
+            plot.setTitle(f'{title} - Threshold Monitoring: {parameter}' if title
+                          else f'Threshold Monitoring: {parameter}')
+                          
+            # Decimate the drawn line to about two points per pixel
+            line_x, line_y, line_masks = self._line_points(cache, max(self.width(), 1) * 2)
+            self._add_threshold_items(plot, parameter)
+            self._add_colored_line(plot, self._epoch_seconds(line_x), line_y, parameter, line_masks)
+            
+            # Add statistical bounds if available
+            param_data = cache['param_data']
+            if 'min' in param_data.columns and 'max' in param_data.columns:
+                range_x = self._epoch_seconds(param_data['datetime'].to_numpy())
+                lower = pg.PlotDataItem(range_x, param_data['min'].to_numpy(dtype=float), pen=None)
+                upper = pg.PlotDataItem(range_x, param_data['max'].to_numpy(dtype=float), pen=None)
+                plot.addItem(pg.FillBetweenItem(lower, upper, brush=pg.mkBrush(0, 0, 255, 25)))
+                
+            # Alert markers use the full series so no violation is missed
+            if cache['masks'] is not None:
+                critical_mask, warning_mask = cache['masks']
+                x_values = self._epoch_seconds(cache['x'])
+                y_display = cache['y_display']
+                if critical_mask.any():
+                    plot.addItem(pg.ScatterPlotItem(x_values[critical_mask], y_display[critical_mask],
+                                                    symbol='x', size=10, pen=None, brush='r',
+                                                    name='Critical Alerts'))
+                if warning_mask.any():
+                    plot.addItem(pg.ScatterPlotItem(x_values[warning_mask], y_display[warning_mask],
+                                                    symbol='t', size=8, pen=None, brush=(255, 165, 0),
+                                                    name='Warning Alerts'))
+                                                    
+            self._drawn = (data, source_fingerprint, parameter, title, auto_detect_thresholds,
+                           self._threshold_bounds.get(parameter))
+            self._emit_threshold_violations(parameter, cache)
+                           
         except Exception as e:
-            print(f"Error getting threshold summary: {e}")
-            return {'parameter': parameter, 'status': 'error'}
+            print(f"Error plotting threshold visualization: {e}")
+            
+    @staticmethod
+    def _epoch_seconds(x_values: np.ndarray) -> np.ndarray:
+        """Convert datetime64 values to the float epoch seconds DateAxisItem expects"""
+        if x_values.dtype.kind == 'M':
+            return x_values.astype('datetime64[ns]').view(np.int64) / 1e9
+        return x_values.astype(float)
+        
+    def _add_colored_line(self, plot, x_values, y_values, parameter: str, masks=None):
+        """Draw the trace as one item per threshold status, using connect masks for the runs"""
+        if masks is None:
+            plot.addItem(pg.PlotDataItem(x_values, y_values, pen=pg.mkPen('b', width=2), name=parameter))
+            return
+            
+        # Edge i -> i+1 takes the status of point i+1, matching ThresholdPlotWidget
+        status = self._status_from_masks(*masks)
+        for label, (color, name) in enumerate(zip(self._STATUS_COLORS, self._STATUS_NAMES)):
+            connect = np.zeros(len(status), dtype=bool)
+            connect[:-1] = status[1:] == label
+            if connect.any():
+                plot.addItem(pg.PlotDataItem(x_values, y_values, connect=connect,
+                                             pen=pg.mkPen(color, width=2), name=name))
+                                             
+    def _add_threshold_items(self, plot, parameter: str):
+        """Add threshold lines and bands to the plot"""
+        thresholds = self.thresholds.get(parameter, {})
+        if not thresholds:
+            return
+            
+        for key, color, style in (('min', 'r', pg.QtCore.Qt.DashLine), ('max', 'r', pg.QtCore.Qt.DashLine),
+                                  ('warning_min', (255, 165, 0), pg.QtCore.Qt.DotLine),
+                                  ('warning_max', (255, 165, 0), pg.QtCore.Qt.DotLine)):
+            if thresholds.get(key) is not None:
+                plot.addItem(pg.InfiniteLine(pos=thresholds[key], angle=0, movable=False,
+                                             pen=pg.mkPen(color, width=2, style=style)))
+                                             
+        bands = (('min', 'warning_min', (255, 0, 0, 25)), ('warning_max', 'max', (255, 0, 0, 25)),
+                 ('warning_min', 'warning_max', (0, 128, 0, 15)))
+        for low, high, rgba in bands:
+            if thresholds.get(low) is not None and thresholds.get(high) is not None:
+                plot.addItem(pg.LinearRegionItem(values=(thresholds[low], thresholds[high]),
+                                                 orientation='horizontal', movable=False,
+                                                 brush=pg.mkBrush(*rgba), pen=pg.mkPen(None)))
 
 
 # Standalone utility functions for backwards compatibility
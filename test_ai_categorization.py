@@ -17,11 +17,10 @@ def test_ai_parameter_categorization():
     print("=" * 60)
     
     try:
-        from unified_parser import UnifiedParser
+        from test_helpers import parse_log
         
         # Parse samlog.txt to get all parameters
-        parser = UnifiedParser()
-        df = parser.parse_linac_file('samlog.txt')
+        df = parse_log('samlog.txt')
         
         if df.empty:
             print("❌ No data to categorize")
@@ -228,7 +228,7 @@ def test_plot_widgets():
         os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
         
         from PyQt5.QtWidgets import QApplication, QWidget
-        from plot_utils import PlotWidget, DualPlotWidget
+        from plot_utils import PlotWidget, DualPlotWidget, ThresholdPlotWidget
         import pandas as pd
         
         app = QApplication.instance() or QApplication(sys.argv)
@@ -254,6 +254,37 @@ def test_plot_widgets():
         dual_widget.update_comparison(sample_data, "Param 1", "Param 2")
         print("  ✓ DualPlotWidget creation and update")
         
+        # Test ThresholdPlotWidget - one instance reused across datasets via reset()
+        threshold_widget = ThresholdPlotWidget(widget)
+        threshold_widget.plot_parameter_with_thresholds(sample_data, "Test Parameter", "Test Chart")
+        assert "Test Parameter" in threshold_widget.thresholds
+        threshold_widget.reset()
+        assert not threshold_widget.thresholds
+        threshold_widget.plot_parameter_with_thresholds(sample_data, "Test Parameter", "Test Chart")
+        print("  ✓ ThresholdPlotWidget plotting and reset")
+        
+        # Test the pyqtgraph variant when pyqtgraph is installed
+        from plot_utils import PYQTGRAPH_AVAILABLE, ThresholdPlotWidgetGL
+        if PYQTGRAPH_AVAILABLE:
+            gl_widget = ThresholdPlotWidgetGL(widget)
+            gl_widget.plot_parameter_with_thresholds(sample_data, "Test Parameter", "Test Chart")
+            assert gl_widget.thresholds["Test Parameter"] == threshold_widget.thresholds["Test Parameter"]
+            assert gl_widget.plot_widget.plotItem.items
+            print("  ✓ ThresholdPlotWidgetGL plotting")
+        else:
+            print("  ⚠️ pyqtgraph not installed - ThresholdPlotWidgetGL skipped")
+        
+        # Violations arrive as one batch per parameter
+        batches = []
+        threshold_widget.threshold_violations.connect(lambda *batch: batches.append(batch))
+        threshold_widget.set_parameter_thresholds("Test Parameter", 0, 4.5, 1.5, 3.5)
+        threshold_widget.plot_parameter_with_thresholds(sample_data, "Test Parameter", "Test Chart")
+        assert len(batches) == 1
+        parameter, critical_rows, warning_rows = batches[0]
+        assert parameter == "Test Parameter"
+        assert critical_rows['avg'].tolist() == [5] and len(warning_rows) == 4
+        print("  ✓ ThresholdPlotWidget violation batch signal")
+        
         print("✅ Plot widgets working correctly")
         return True
         
@@ -7,27 +7,28 @@ import sys
 import os
 sys.path.append('.')
 
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for testing
-import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from itertools import islice
 
-from plot_utils import PlotUtils
+# Seeded generator so the sample data (and saved figure) are reproducible
+_RNG = np.random.default_rng(42)
 
 def create_sample_data():
     """Create sample LINAC monitoring data for visualization testing"""
+    import pandas as pd
+    
     # Generate timestamps over 24 hours
     start_time = datetime.now() - timedelta(hours=24)
-    timestamps = [start_time + timedelta(minutes=x*5) for x in range(288)]  # Every 5 minutes
+    timestamps = pd.date_range(start_time, periods=288, freq='5min')  # Every 5 minutes
     
     # Create sample data for different parameter types
     data = []
     
     # CPU Temperature data (enhanced with noise)
     base_temp = 42.0
-    cpu_temps = [base_temp + 3*np.sin(x/10) + np.random.normal(0, 1) for x in range(len(timestamps))]
+    x = np.arange(len(timestamps))
+    cpu_temps = base_temp + 3*np.sin(x/10) + _RNG.normal(0, 1, len(timestamps))
     
     for i, (ts, temp) in enumerate(zip(timestamps, cpu_temps)):
         data.append({
@@ -58,7 +59,7 @@ def create_sample_data():
         })
     
     # Flow rate data 
-    flow_rates = [15.5 + 2*np.sin(x/20) + np.random.normal(0, 0.5) for x in range(len(timestamps))]
+    flow_rates = 15.5 + 2*np.sin(x/20) + _RNG.normal(0, 0.5, len(timestamps))
     
     for i, (ts, flow) in enumerate(zip(timestamps[::3], flow_rates[::3])):  # Every 15 minutes
         data.append({
@@ -79,6 +80,13 @@ def test_colorful_visualization():
     print("🎨 Testing Enhanced Colorful LINAC Visualizations")
     print("=" * 55)
     
+    # Plotting stack (and Qt via plot_utils) is only loaded when the test runs,
+    # so collecting this module stays cheap
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend for testing
+    import matplotlib.pyplot as plt
+    from plot_utils import PlotUtils
+    
     # Create sample data
     df = create_sample_data()
     print(f"📊 Generated {len(df)} sample data points")
@@ -125,10 +133,10 @@ def test_colorful_visualization():
     mode_data = df[df['parameter'] == 'system_mode'].copy()
     if not mode_data.empty:
         mode_colors = {'SERVICE': colors['system_mode'], 'TREATMENT': '#FF4757'}
-        for i, (_, row) in enumerate(mode_data.iterrows()):
-            ax3.barh(i, 1, color=mode_colors.get(row['value'], '#CCC'), 
+        for i, mode in enumerate(mode_data['value'].tolist()):
+            ax3.barh(i, 1, color=mode_colors.get(mode, '#CCC'), 
                     alpha=0.7, height=0.6)
-            ax3.text(0.5, i, row['value'], ha='center', va='center', 
+            ax3.text(0.5, i, mode, ha='center', va='center', 
                     fontweight='bold', color='white')
         ax3.set_title('⚙️ System Mode Changes', fontweight='bold')
         ax3.set_yticks(range(len(mode_data)))
@@ -137,11 +145,10 @@ def test_colorful_visualization():
     
     # Plot 4: Color palette showcase
     ax4 = axes[1, 1]
-    param_types = list(colors.keys())[:8]  # First 8 parameters
-    y_positions = range(len(param_types))
+    palette_items = list(islice(colors.items(), 8))  # First 8 parameters
     
-    for i, param_type in enumerate(param_types):
-        ax4.barh(i, 100, color=colors[param_type], alpha=0.8, height=0.7)
+    for i, (param_type, color) in enumerate(palette_items):
+        ax4.barh(i, 100, color=color, alpha=0.8, height=0.7)
         ax4.text(50, i, param_type.replace('_', ' ').title(), 
                 ha='center', va='center', fontweight='bold', color='white')
     
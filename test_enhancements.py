@@ -10,9 +10,7 @@ Tests the key issues identified in the problem statement:
 
 import sys
 import os
-import pandas as pd
 from datetime import datetime, timedelta
-import numpy as np
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -70,6 +68,8 @@ def test_duration_formatting():
             (timedelta(days=20, hours=5), "20 days, 5 hours, 0 minutes"),
         ]
         
+        import pandas as pd
+        
         # Define the formatting function (extracted from main.py fix)
         def format_duration(td):
             """Format timedelta to show days, hours, minutes"""
@@ -179,6 +179,35 @@ def test_plot_utils_continuity():
         print(f"❌ Plot Utils continuity test failed: {e}")
         return False
 
+def test_threshold_plot_downsampling():
+    """Test that LTTB decimation keeps the endpoints and isolated spikes"""
+    print("\n🧪 Testing Threshold Plot Downsampling...")
+    
+    try:
+        import numpy as np
+        from plot_utils import ThresholdPlotWidget
+        
+        n_points, target = 100000, 1000
+        x = np.arange(n_points, dtype=np.int64)
+        y = np.sin(x / 500.0)
+        spike = 54321
+        y[spike] = 25.0
+        
+        keep = ThresholdPlotWidget._downsample_lttb(x, y, target)
+        print(f"  {n_points} points → {len(keep)} drawn")
+        
+        assert len(keep) == target, f"Expected {target} points, got {len(keep)}"
+        assert keep[0] == 0 and keep[-1] == n_points - 1, "Endpoints must be kept"
+        assert np.all(np.diff(keep) > 0), "Indices must be strictly increasing"
+        assert spike in keep, "Spike was dropped by decimation"
+        
+        print("✅ Threshold plot downsampling test passed")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Threshold plot downsampling test failed: {e}")
+        return False
+
 def main():
     """Run all enhancement tests"""
     print("🔧 HALog Enhancement Validation Tests")
@@ -188,7 +217,8 @@ def main():
         test_enhanced_parameter_mapper,
         test_duration_formatting,
         test_unified_parser_enhancements,
-        test_plot_utils_continuity
+        test_plot_utils_continuity,
+        test_threshold_plot_downsampling
     ]
     
     results = []
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the HALOGx test scripts.
+Parser and mapper construction (which loads mapedname.txt) and the parse of
+samlog.txt are cached so a test process pays for them once instead of once
+per test.
+"""
+
+import io
+import os
+import re
+import sqlite3
+import sys
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
+sys.path.append('.')
+
+# Failures the import/UI scripts report as a failed step; anything else is a
+# bug and propagates to the runner (pandas parse errors subclass ValueError)
+EXPECTED_ERRORS = (ImportError, OSError, sqlite3.Error, KeyError, ValueError)
+
+
+@lru_cache(maxsize=1)
+def get_parser():
+    """Return a process-wide UnifiedParser.
+
+    Only use this where the test reads the parsed DataFrame; parsing_stats
+    counters such as parameters_skipped accumulate across parses.
+    """
+    from unified_parser import UnifiedParser
+    return UnifiedParser()
+
+
+@lru_cache(maxsize=1)
+def get_mapper():
+    """Return a process-wide EnhancedParameterMapper for read-only checks"""
+    from enhanced_parameter_mapper import EnhancedParameterMapper
+    return EnhancedParameterMapper()
+
+
+@lru_cache(maxsize=4)
+def _parsed(path, mtime):
+    """Parse a log file once per (absolute path, mtime) pair"""
+    return get_parser().parse_linac_file(path)
+
+
+def parse_log(path='samlog.txt'):
+    """Return the parsed DataFrame for a log file, reusing earlier parses.
+
+    A shallow copy is returned so callers can add or drop columns without
+    affecting the cached frame; editing cell values in place is not safe.
+    """
+    path = os.path.abspath(path)
+    return _parsed(path, os.path.getmtime(path)).copy(deep=False)
+
+
+def keyword_re(*keywords):
+    """Compile one alternation matching any of the (lower-case) keywords"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+def ui_trend_view(df):
+    """Return the avg trend frame the UI gets from the database, built in memory.
+
+    Mirrors DatabaseManager.get_all_logs(columns=['datetime', 'param', 'avg'])
+    on freshly parsed records, so UI-shape checks can skip the SQLite
+    round-trip. Unlike get_all_logs, rows are sorted by datetime, so the
+    time span is the first and last ``datetime`` values.
+    """
+    view = df.loc[df['statistic_type'] == 'avg', ['datetime', 'parameter_type', 'value']]
+    view = view.rename(columns={'parameter_type': 'param', 'value': 'avg'})
+    view = view.sort_values('datetime', kind='stable').reset_index(drop=True)
+    return view.astype({'param': 'category'})
+
+def _keyword_mask(lowered, keywords):
+    """Boolean mask of lower-cased names matching a keyword pattern or list"""
+    if not isinstance(keywords, re.Pattern):
+        keywords = keyword_re(*keywords)
+    return lowered.str.contains(keywords, regex=True)
+
+
+def params_matching(params, keywords):
+    """Return the parameter names whose lower-cased form contains any keyword.
+
+    ``keywords`` is either a list of keywords or a pattern from keyword_re().
+    """
+    import pandas as pd
+    params = pd.Series(params, dtype=object)
+    return params[_keyword_mask(params.str.lower(), keywords)].tolist()
+
+
+def categorize_params(params, keyword_groups, default='Other'):
+    """Split parameter names into categories, first matching group wins.
+
+    keyword_groups maps category name to its keywords (or keyword_re()
+    pattern) in priority order; names matching no group land in ``default``.
+    """
+    import pandas as pd
+    params = pd.Series(params, dtype=object)
+    lowered = params.str.lower()
+    unassigned = pd.Series(True, index=params.index)
+    categories = {}
+    for category, keywords in keyword_groups.items():
+        mask = unassigned & _keyword_mask(lowered, keywords)
+        categories[category] = params[mask].tolist()
+        unassigned &= ~mask
+    categories[default] = params[unassigned].tolist()
+    return categories
+
+
+@contextmanager
+def buffered_output(verbose=None):
+    """Collect stdout and write it with a single call on exit.
+
+    Pass ``--verbose`` on the command line (or verbose=True) to stream
+    output as it is printed instead.
+    """
+    if verbose is None:
+        verbose = '--verbose' in sys.argv
+    if verbose:
+        yield
+        return
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
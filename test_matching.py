@@ -5,10 +5,9 @@ Test if the extracted parameters match the mapedname.txt mappings
 
 import sys
 import os
-import pandas as pd
 sys.path.append('.')
 
-from unified_parser import UnifiedParser
+from test_helpers import parse_log
 
 def test_parameter_matching():
     """Test if extracted parameters match mapedname.txt mappings"""
@@ -16,8 +15,7 @@ def test_parameter_matching():
     print("=" * 50)
     
     # Parse samlog.txt
-    parser = UnifiedParser()
-    df = parser.parse_linac_file('samlog.txt')
+    df = parse_log('samlog.txt')
     
     if df.empty:
         print("❌ No data extracted")
@@ -32,17 +30,20 @@ def test_parameter_matching():
     mapedname_path = "data/mapedname.txt"
     mappings = {}
     with open(mapedname_path, 'r') as f:
-        lines = f.readlines()
-    
-    for line in lines[2:]:  # Skip header lines
-        line = line.strip()
-        if line and '|' in line:
-            parts = [p.strip() for p in line.split('|')]
-            if len(parts) >= 3 and parts[0] and not parts[0].startswith('-'):
-                mappings[parts[0]] = {
-                    'friendly_name': parts[1],
-                    'unit': parts[2]
-                }
+        next(f, None)  # Skip header lines
+        next(f, None)
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('-') or '|' not in line:
+                continue
+            parts = line.split('|', 3)
+            if len(parts) >= 3:
+                machine_name = parts[0].strip()
+                if machine_name:
+                    mappings[machine_name] = {
+                        'friendly_name': parts[1].strip(),
+                        'unit': parts[2].strip()
+                    }
     
     print(f"📋 Loaded {len(mappings)} parameter mappings")
     
@@ -8,14 +8,36 @@ import os
 import sys
 sys.path.append('.')
 
+from test_helpers import get_mapper
+
+# Filtering cases: (parameter_name, should_be_allowed)
+_FILTER_CASES = (
+    ("magnetronFlow", True),
+    ("targetAndCirculatorFlow", True), 
+    ("CoolingmagnetronFlowLowStatistics", True),  # Should be allowed because it's in merged params
+    ("CoolingtargetFlowLowStatistics", True),     # Should be allowed because it's in merged params
+    ("FanremoteTempStatistics", True),
+    ("randomUnmappedParameter", False),
+    ("anotherInvalidParam", False),
+    ("unknownStatistic", False),
+)
+_FILTER_PARAMS = frozenset(param for param, _ in _FILTER_CASES)
+
+# Merging cases: (parameter_name, should_merge, expected_unified_name)
+_MERGE_CASES = (
+    ("magnetronFlow", True, "magnetronFlow"),
+    ("CoolingmagnetronFlowLowStatistics", True, "magnetronFlow"),
+    ("targetAndCirculatorFlow", True, "targetAndCirculatorFlow"),
+    ("CoolingtargetFlowLowStatistics", True, "targetAndCirculatorFlow"),
+    ("FanremoteTempStatistics", False, "FanremoteTempStatistics"),
+)
+
 def test_enhanced_mapper_counts():
     """Test that enhanced mapper loads correct parameter counts"""
-    from enhanced_parameter_mapper import EnhancedParameterMapper
-    
     print("🧪 Testing Enhanced Parameter Mapper Counts")
     print("=" * 50)
     
-    mapper = EnhancedParameterMapper()
+    mapper = get_mapper()
     stats = mapper.get_mapping_statistics()
     
     print(f"✅ Total mappings loaded: {stats['total_mappings']}")
@@ -36,28 +58,20 @@ def test_enhanced_mapper_counts():
 
 def test_parameter_filtering():
     """Test that parameter filtering works correctly"""
-    from enhanced_parameter_mapper import EnhancedParameterMapper
-    
     print("\n🧪 Testing Parameter Filtering")
     print("=" * 30)
     
-    mapper = EnhancedParameterMapper()
+    mapper = get_mapper()
+    
+    results = {param: mapper.is_parameter_allowed(param) for param in _FILTER_PARAMS}
     
-    # Test cases: (parameter_name, should_be_allowed)
-    test_cases = [
-        ("magnetronFlow", True),
-        ("targetAndCirculatorFlow", True), 
-        ("CoolingmagnetronFlowLowStatistics", True),  # Should be allowed because it's in merged params
-        ("CoolingtargetFlowLowStatistics", True),     # Should be allowed because it's in merged params
-        ("FanremoteTempStatistics", True),
-        ("randomUnmappedParameter", False),
-        ("anotherInvalidParam", False),
-        ("unknownStatistic", False)
-    ]
+    # The frozen allowlist alone splits these cases the same way
+    expected_allowed = {param for param, expected in _FILTER_CASES if expected}
+    assert _FILTER_PARAMS & mapper.allowed_set == expected_allowed, "allowed_set does not match the expected allowlist split"
     
     all_passed = True
-    for param, expected in test_cases:
-        result = mapper.is_parameter_allowed(param)
+    for param, expected in _FILTER_CASES:
+        result = results[param]
         status = "✅" if result == expected else "❌"
         print(f"  {status} {param}: {'ALLOWED' if result else 'FILTERED'} (expected: {'ALLOWED' if expected else 'FILTERED'})")
         if result != expected:
@@ -68,28 +82,18 @@ def test_parameter_filtering():
     else:
         print("❌ Some filtering tests failed!")
     
+    assert all_passed, "is_parameter_allowed misclassified a filtering case"
     return all_passed
 
 def test_merging_logic():
     """Test parameter merging logic"""
-    from enhanced_parameter_mapper import EnhancedParameterMapper
-    
     print("\n🧪 Testing Parameter Merging Logic")
     print("=" * 35)
     
-    mapper = EnhancedParameterMapper()
-    
-    # Test merged parameters
-    test_cases = [
-        ("magnetronFlow", True, "magnetronFlow"),
-        ("CoolingmagnetronFlowLowStatistics", True, "magnetronFlow"),
-        ("targetAndCirculatorFlow", True, "targetAndCirculatorFlow"),
-        ("CoolingtargetFlowLowStatistics", True, "targetAndCirculatorFlow"),
-        ("FanremoteTempStatistics", False, "FanremoteTempStatistics")
-    ]
+    mapper = get_mapper()
     
     all_passed = True
-    for param, should_merge, expected_unified in test_cases:
+    for param, should_merge, expected_unified in _MERGE_CASES:
         should_merge_result, unified_name, sources = mapper.should_merge_parameter(param)
         status = "✅" if should_merge_result == should_merge and unified_name == expected_unified else "❌"
         print(f"  {status} {param}: {'MERGE' if should_merge_result else 'NO MERGE'} → {unified_name}")
@@ -2,16 +2,24 @@
 """
 Test UI Integration - Verify data preparation for Trend and Analysis tabs
 Tests the complete workflow: parse samlog.txt -> prepare data for graphs -> validate UI data structure
+The database round-trip is covered separately by test_db_roundtrip so the UI
+shape checks can run on the parsed records directly.
 """
 
 import sys
-import os
-import tempfile
 from pathlib import Path
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from test_helpers import EXPECTED_ERRORS, buffered_output, keyword_re
+
+# Trend sub-tab keyword patterns, compiled once per process
+WATER_RE = keyword_re('flow', 'water', 'cooling', 'pump')
+TEMP_RE = keyword_re('temp', 'temperature')
+VOLT_RE = keyword_re('voltage', 'volt', '_v', 'adc')
+BGM_RE = keyword_re('magnetron', 'target', 'circulator')
+
 def test_ui_data_preparation():
     """Test data preparation for UI graphs and trends"""
     print("🖥️  Testing UI Data Preparation for Graphs")
@@ -19,15 +27,13 @@ def test_ui_data_preparation():
     
     try:
         # Import required modules
-        from unified_parser import UnifiedParser
-        from database import DatabaseManager
+        from test_helpers import parse_log, params_matching, ui_trend_view
         
         print("✓ Modules imported successfully")
         
         # Step 1: Parse samlog.txt
         print("\n📊 Step 1: Parsing samlog.txt for UI...")
-        parser = UnifiedParser()
-        df = parser.parse_linac_file('samlog.txt')
+        df = parse_log('samlog.txt')
         
         if df.empty:
             print("❌ No data extracted - UI will show 'No valid data found'")
@@ -35,125 +41,131 @@ def test_ui_data_preparation():
             
         print(f"✓ Extracted {len(df)} records for UI display")
         
-        # Step 2: Prepare data for database (simulating UI upload)
-        print("\n💾 Step 2: Simulating UI file upload workflow...")
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_db:
-            db_path = tmp_db.name
+        # Step 2: Build the trend frame the UI would load from the database
+        print("\n📈 Step 2: Preparing data for Trend and Analysis tabs...")
+        retrieved_df = ui_trend_view(df)
+        print(f"✓ Prepared {len(retrieved_df)} records for UI display")
         
-        try:
-            db = DatabaseManager(db_path)
-            records_inserted = db.insert_data_batch(df)
-            print(f"✓ Database insert: {records_inserted} records")
-            
-            # Step 3: Retrieve data for UI display (as the UI would)
-            print("\n📈 Step 3: Preparing data for Trend and Analysis tabs...")
-            
-            # Get data for trends (as UI retrieval would work)
-            retrieved_df = db.get_all_logs()
-            print(f"✓ Retrieved {len(retrieved_df)} records for UI display")
-            
-            if len(retrieved_df) == 0:
-                print("❌ UI would show 'No data available' - this would be the user-visible issue")
-                return False
-            
-            # Step 4: Validate UI data structure
-            print("\n🔍 Step 4: Validating data structure for UI graphs...")
-            
-            required_columns = ['datetime', 'param', 'avg']
-            available_columns = retrieved_df.columns.tolist()
-            print(f"✓ Available columns: {available_columns}")
-            
-            missing_columns = [col for col in required_columns if col not in available_columns]
-            if missing_columns:
-                print(f"⚠️ Missing columns for UI: {missing_columns}")
-            else:
-                print("✓ All required columns present for UI graphs")
-            
-            # Step 5: Test parameter categorization for Trend tabs
-            print("\n🏷️ Step 5: Testing parameter categorization for Trend sub-tabs...")
-            
-            unique_params = retrieved_df['param'].unique()
-            print(f"✓ Found {len(unique_params)} unique parameters for graphs")
-            
-            # Categorize parameters for UI tabs
-            water_params = [p for p in unique_params if any(keyword in p.lower() 
-                          for keyword in ['flow', 'water', 'cooling', 'pump'])]
-            temp_params = [p for p in unique_params if any(keyword in p.lower() 
-                         for keyword in ['temp', 'temperature'])]
-            voltage_params = [p for p in unique_params if any(keyword in p.lower() 
-                            for keyword in ['voltage', 'volt', '_v', 'adc'])]
-            
-            print(f"✓ Water System parameters: {len(water_params)} (for Water System tab)")
-            print(f"✓ Temperature parameters: {len(temp_params)} (for Temperature tab)")
-            print(f"✓ Voltage parameters: {len(voltage_params)} (for Voltage tab)")
-            
-            # Step 6: Test specific BGMFPGASensor parameters
-            print("\n🎯 Step 6: Verifying BGMFPGASensor::logStatistics parameters...")
-            
-            bgm_params = [p for p in unique_params if any(keyword in p.lower() 
-                         for keyword in ['magnetron', 'target', 'circulator'])]
+        if len(retrieved_df) == 0:
+            print("❌ UI would show 'No data available' - this would be the user-visible issue")
+            return False
+        
+        # Step 3: Validate UI data structure
+        print("\n🔍 Step 3: Validating data structure for UI graphs...")
+        
+        required_columns = ['datetime', 'param', 'avg']
+        available_columns = retrieved_df.columns.tolist()
+        print(f"✓ Available columns: {available_columns}")
+        
+        missing_columns = [col for col in required_columns if col not in available_columns]
+        if missing_columns:
+            print(f"⚠️ Missing columns for UI: {missing_columns}")
+        else:
+            print("✓ All required columns present for UI graphs")
+        
+        # Step 4: Test parameter categorization for Trend tabs
+        print("\n🏷️ Step 4: Testing parameter categorization for Trend sub-tabs...")
+        
+        unique_params = retrieved_df['param'].unique()
+        print(f"✓ Found {len(unique_params)} unique parameters for graphs")
+        
+        # Partition rows by parameter once for the per-parameter checks below
+        grouped = retrieved_df.groupby('param', sort=False)
+        
+        # Categorize parameters for UI tabs
+        water_params = params_matching(unique_params, WATER_RE)
+        temp_params = params_matching(unique_params, TEMP_RE)
+        voltage_params = params_matching(unique_params, VOLT_RE)
+        
+        print(f"✓ Water System parameters: {len(water_params)} (for Water System tab)")
+        print(f"✓ Temperature parameters: {len(temp_params)} (for Temperature tab)")
+        print(f"✓ Voltage parameters: {len(voltage_params)} (for Voltage tab)")
+        
+        # Step 5: Test specific BGMFPGASensor parameters
+        print("\n🎯 Step 5: Verifying BGMFPGASensor::logStatistics parameters...")
+        
+        bgm_params = params_matching(unique_params, BGM_RE)
+        
+        if len(bgm_params) > 0:
+            print(f"✓ Found {len(bgm_params)} BGMFPGASensor parameters:")
+            avg_stats = grouped['avg'].agg(['min', 'max', 'size'])
+            for param in bgm_params[:5]:  # Show first 5
+                if param in avg_stats.index:
+                    stats = avg_stats.loc[param]
+                    avg_range = f"{stats['min']:.2f} - {stats['max']:.2f}"
+                    print(f"   • {param}: {int(stats['size'])} data points, range: {avg_range}")
+            print("✅ BGMFPGASensor parameters ready for graph rendering!")
+        else:
+            print("⚠️ No BGMFPGASensor parameters found - check parameter mapping")
+        
+        # Step 6: Validate graph data readiness
+        print("\n📊 Step 6: Final validation for graph rendering...")
+        
+        # Check if we have time series data
+        if 'datetime' in retrieved_df.columns:
+            date_range = retrieved_df['datetime'].iloc[-1] - retrieved_df['datetime'].iloc[0]
+            print(f"✓ Time series data: {date_range}")
             
-            if len(bgm_params) > 0:
-                print(f"✓ Found {len(bgm_params)} BGMFPGASensor parameters:")
-                for param in bgm_params[:5]:  # Show first 5
-                    sample_data = retrieved_df[retrieved_df['param'] == param]
-                    if len(sample_data) > 0:
-                        avg_range = f"{sample_data['avg'].min():.2f} - {sample_data['avg'].max():.2f}"
-                        print(f"   • {param}: {len(sample_data)} data points, range: {avg_range}")
-                print("✅ BGMFPGASensor parameters ready for graph rendering!")
-            else:
-                print("⚠️ No BGMFPGASensor parameters found - check parameter mapping")
+            # Check for multiple data points per parameter (needed for graphs)
+            sizes = grouped.size().reindex(unique_params[:10], fill_value=0)  # Check first 10 parameters
+            multi_point_params = sizes[sizes > 1].index.tolist()
             
-            # Step 7: Validate graph data readiness
-            print("\n📊 Step 7: Final validation for graph rendering...")
+            print(f"✓ Parameters with multiple data points: {len(multi_point_params)}")
             
-            # Check if we have time series data
-            if 'datetime' in retrieved_df.columns:
-                date_range = retrieved_df['datetime'].max() - retrieved_df['datetime'].min()
-                print(f"✓ Time series data: {date_range}")
-                
-                # Check for multiple data points per parameter (needed for graphs)
-                multi_point_params = []
-                for param in unique_params[:10]:  # Check first 10 parameters
-                    param_data = retrieved_df[retrieved_df['param'] == param]
-                    if len(param_data) > 1:
-                        multi_point_params.append(param)
-                
-                print(f"✓ Parameters with multiple data points: {len(multi_point_params)}")
-                
-                if len(multi_point_params) > 0:
-                    print("✅ UI graph rendering should work correctly!")
-                    return True
-                else:
-                    print("⚠️ Limited data points - graphs may be sparse")
-                    return True
+            if len(multi_point_params) > 0:
+                print("✅ UI graph rendering should work correctly!")
+                return True
             else:
-                print("❌ No datetime column - graphs cannot be rendered")
-                return False
-                
-        finally:
-            # Cleanup
-            try:
-                os.unlink(db_path)
-            except:
-                pass
+                print("⚠️ Limited data points - graphs may be sparse")
+                return True
+        else:
+            print("❌ No datetime column - graphs cannot be rendered")
+            return False
                 
-    except Exception as e:
+    except EXPECTED_ERRORS as e:
         print(f"❌ Error in UI preparation test: {e}")
         import traceback
         traceback.print_exc()
         return False
 
+def test_db_roundtrip():
+    """Test that parsed records survive the database insert unchanged in count"""
+    print("\n💾 Testing Database Round-trip for UI Upload")
+    print("=" * 60)
+    
+    from test_helpers import parse_log
+    from database import DatabaseManager
+    
+    df = parse_log('samlog.txt')
+    assert len(df) > 0, "No records parsed from samlog.txt"
+    
+    db = DatabaseManager(':memory:')
+    records_inserted = db.bulk_load(df)
+    stored = db.get_record_count()
+    print(f"✓ Database insert: {records_inserted} records, {stored} stored")
+    
+    assert stored == len(df), f"Expected {len(df)} stored records, got {stored}"
+    print("✅ All parsed records stored for the UI to load")
+
+def _db_roundtrip_passed():
+    """Run test_db_roundtrip for the script runner, reporting failure as False"""
+    try:
+        test_db_roundtrip()
+        return True
+    except (AssertionError, *EXPECTED_ERRORS) as e:
+        print(f"❌ Error in database round-trip test: {e}")
+        return False
+
 def test_mapedname_integration():
     """Test mapedname.txt integration for user-friendly parameter names"""
     print("\n📋 Testing mapedname.txt Integration for UI Display")
     print("=" * 60)
     
     try:
-        from enhanced_parameter_mapper import EnhancedParameterMapper
+        from test_helpers import get_mapper
         
         # Test parameter mapping
-        mapper = EnhancedParameterMapper()
+        mapper = get_mapper()
         
         # Test key BGMFPGASensor parameters
         test_params = [
@@ -171,30 +183,43 @@ def test_mapedname_integration():
         print("✅ Parameter mapping working for user-friendly UI display")
         return True
         
-    except Exception as e:
+    except EXPECTED_ERRORS as e:
         print(f"❌ Error in mapedname integration test: {e}")
         return False
 
 if __name__ == "__main__":
-    print("🧪 HALOGx UI Integration Test Suite")
-    print("=" * 60)
+    with buffered_output():
+        print("🧪 HALOGx UI Integration Test Suite")
+        print("=" * 60)
+    
+        # Parse once up front: the cache does not serialize a miss, so two
+        # threads would otherwise parse concurrently on the shared parser
+        from test_helpers import parse_log
+        parse_log('samlog.txt')
     
-    # Run tests
-    ui_test_passed = test_ui_data_preparation()
-    mapping_test_passed = test_mapedname_integration()
+        # Run the independent tests concurrently (output may interleave)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            ui_future = executor.submit(test_ui_data_preparation)
+            db_future = executor.submit(_db_roundtrip_passed)
+            mapping_future = executor.submit(test_mapedname_integration)
+            ui_test_passed = ui_future.result()
+            db_test_passed = db_future.result()
+            mapping_test_passed = mapping_future.result()
     
-    print("\n" + "=" * 60)
-    print("📊 Test Results Summary:")
-    print(f"   UI Data Preparation: {'✅ PASS' if ui_test_passed else '❌ FAIL'}")
-    print(f"   Parameter Mapping: {'✅ PASS' if mapping_test_passed else '❌ FAIL'}")
+        print("\n" + "=" * 60)
+        print("📊 Test Results Summary:")
+        print(f"   UI Data Preparation: {'✅ PASS' if ui_test_passed else '❌ FAIL'}")
+        print(f"   Database Round-trip: {'✅ PASS' if db_test_passed else '❌ FAIL'}")
+        print(f"   Parameter Mapping: {'✅ PASS' if mapping_test_passed else '❌ FAIL'}")
     
-    if ui_test_passed and mapping_test_passed:
-        print("\n🎉 ALL TESTS PASSED!")
-        print("✅ UI should display graphs correctly with samlog.txt")
-        print("✅ Trend and Analysis tabs should work properly")
-        print("✅ 'No valid data found' error has been resolved!")
-    else:
-        print("\n❌ SOME TESTS FAILED!")
-        print("❗ UI may still experience issues")
+        if ui_test_passed and db_test_passed and mapping_test_passed:
+            print("\n🎉 ALL TESTS PASSED!")
+            print("✅ UI should display graphs correctly with samlog.txt")
+            print("✅ Trend and Analysis tabs should work properly")
+            print("✅ 'No valid data found' error has been resolved!")
+        else:
+            print("\n❌ SOME TESTS FAILED!")
+            print("❗ UI may still experience issues")
     
-    print("=" * 60)
\ No newline at end of file
+        print("=" * 60)
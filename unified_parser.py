@@ -12,6 +12,7 @@ Company: gobioeng.com
 
 import pandas as pd
 import re
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import os
@@ -33,6 +34,71 @@ except ImportError:
     ENHANCED_MAPPING_AVAILABLE = False
     print("⚠️ Enhanced parameter mapping not available - using basic mapping")
 
+# Substrings marking a (lower-cased) line as carrying statistics; 'stat' also
+# covers 'statistics'. str.__contains__ runs each scan in C, which measured
+# faster than one fused alternation regex for this short list.
+_STATISTICS_KEYWORDS = (
+    'stat', 'count=', 'avg=', 'max=', 'min=', 'value=', 'reading=', 'measurement='
+)
+
+# Characters dropped when building pattern lookup keys (spaces, colons and
+# underscores); one str.translate pass instead of three chained replace() calls
+_PATTERN_KEY_TABLE = str.maketrans('', '', ' :_')
+
+# Message markers checked by _parse_tab_separated_line. The checks are not
+# exclusive (a logStatistics line for cpuTemperatureSensor0 feeds both the
+# statistics and the temperature extractor), so each stays a plain C substring
+# test rather than one alternation that could only report the first match.
+_STATISTIC_VALUE_KEYS = ('count=', 'max=', 'min=', 'avg=')
+_EVENT_MARKERS = ('EMO Good', 'Disable Motion', 'Enable Motion')
+
+# Output columns holding a few dozen distinct names at most
+_CATEGORICAL_COLUMNS = ('param', 'parameter_type', 'statistic_type')
+
+# Extraction patterns for tab-separated log messages, compiled once at import
+# rather than on every call
+# logStatistics parameterName: count=X, max=Y, min=Z, avg=W
+_LOG_STATS_RE = re.compile(
+    r'logStatistics\s+([^:]+):\s*'
+    r'(?:count\s*=\s*(\d+)[,\s]*)?'
+    r'(?:max\s*=\s*([\d.\-+eE]+)[,\s]*)?'
+    r'(?:min\s*=\s*([\d.\-+eE]+)[,\s]*)?'
+    r'(?:avg\s*=\s*([\d.\-+eE]+))?',
+    re.IGNORECASE
+)
+# cpuTemperatureSensorN / TemperatureSensorN statistics
+_TEMP_SENSOR_RE = re.compile(
+    r'(cpuTemperatureSensor\d+|TemperatureSensor\d+):\s*'
+    r'(?:count\s*=\s*(\d+)[,\s]*)?'
+    r'(?:max\s*=\s*([\d.\-+eE]+)[,\s]*)?'
+    r'(?:min\s*=\s*([\d.\-+eE]+)[,\s]*)?'
+    r'(?:avg\s*=\s*([\d.\-+eE]+))?',
+    re.IGNORECASE
+)
+_SYSTEM_MODE_RE = re.compile(r'SystemMode:(\w+)', re.IGNORECASE)
+_SERIAL_DIGITS_RE = re.compile(r'(\d+)')
+
+# Field order of the row tuples built by UnifiedParser._create_record. Rows are
+# tuples rather than dicts: about a third of the memory per record, and pandas
+# builds the frame from them without hashing keys per row.
+_RECORD_COLUMNS = (
+    'datetime', 'parameter', 'value', 'unit', 'serial_number',
+    'system', 'component', 'line_number', 'source'
+)
+
+
+def _parse_log_datetime(date_str: str, time_str: str) -> datetime:
+    """Parse a log 'YYYY-MM-DD' date and 'HH:MM:SS' time into a datetime.
+
+    Strings with exactly that layout go through the C fromisoformat, many
+    times faster than strptime; anything else falls back to strptime, which
+    raises ValueError as before for malformed input.
+    """
+    if (len(date_str) == 10 and len(time_str) == 8 and date_str[4] == '-' and date_str[7] == '-'
+            and time_str[2] == ':' and time_str[5] == ':'):
+        return datetime.fromisoformat(f"{date_str} {time_str}")
+    return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
+
 
 class UnifiedParser:
     """
@@ -42,6 +108,21 @@ class UnifiedParser:
     - Short data files (additional diagnostic parameters)
     """
 
+    # Parameter-specific validation ranges based on typical LINAC values, built
+    # once instead of on every _get_parameter_range() call
+    _PARAMETER_RANGES: Dict[str, Tuple[float, float]] = {
+        'magnetronFlow': (8.0, 18.0),
+        'targetAndCirculatorFlow': (8.0, 18.0),
+        'magnetronTemp': (20.0, 80.0),
+        'targetAndCirculatorTemp': (20.0, 80.0),
+        'sf6GasPressure': (10.0, 50.0),
+        'boardTemperature': (20.0, 80.0),
+        'cpuTemperatureSensor0': (20.0, 80.0),
+        'cpuTemperatureSensor1': (20.0, 80.0),
+        'humidity': (0.0, 100.0),
+        'fanSpeed': (0.0, 5000.0),
+    }
+
     def __init__(self):
         self._compile_patterns()
         self.parsing_stats = {
@@ -51,6 +132,9 @@ class UnifiedParser:
             "processing_time": 0,
         }
         self.fault_codes: Dict[str, Dict[str, str]] = {}
+        # Raw SN# field -> _extract_serial_from_field() result; a log carries
+        # one or a few serials, so each field is parsed only once
+        self._serials: Dict[str, str] = {}
         self.parameter_mapping = {}  # Initialize before calling _init_parameter_mapping
         self.df: Optional[pd.DataFrame] = None # Initialize df to None
         
@@ -93,7 +177,8 @@ class UnifiedParser:
             "parameters_skipped": 0,
             "valid_records_extracted": 0,
             "skipped_records": 0,
-            "skipped_reasons": {},
+            "skipped_reasons": Counter(),
+            "errors_encountered": 0,
             "merged_parameter_records": 0,
             "parsing_start_time": None,
             "parsing_end_time": None,
@@ -122,11 +207,11 @@ class UnifiedParser:
         }
 
     def _compile_patterns(self):
-        """Compile regex patterns for enhanced log parsing"""
+        """Compile regex patterns for enhanced log parsing (logs are ASCII)"""
         self.patterns = {
             # Enhanced datetime patterns
             "datetime": re.compile(
-                r"(\d{4}-\d{2}-\d{2})[ \t]+(\d{2}:\d{2}:\d{2})", re.IGNORECASE
+                r"(\d{4}-\d{2}-\d{2})[ \t]+(\d{2}:\d{2}:\d{2})"
             ),
             "datetime_alt": re.compile(
                 r"(\d{1,2}/\d{1,2}/\d{4})[ \t]+(\d{1,2}:\d{2}:\d{2})"
@@ -140,12 +225,12 @@ class UnifiedParser:
                 r"(?:[,\s]*max\s*=\s*([\d.\-+eE]+))?"           # Optional max
                 r"(?:[,\s]*min\s*=\s*([\d.\-+eE]+))?"           # Optional min  
                 r"(?:[,\s]*avg\s*=\s*([\d.\-+eE]+))?"           # Optional avg
-                , re.IGNORECASE
+                , re.IGNORECASE | re.ASCII
             ),
             # Serial number patterns with more variations
-            "serial_number": re.compile(r"(?:SN|S/N|Serial)[#\s]*(\d+)", re.IGNORECASE),
-            "serial_alt": re.compile(r"Serial[:\s]+(\d+)", re.IGNORECASE),
-            "machine_id": re.compile(r"Machine[:\s]+(\d+)", re.IGNORECASE),
+            "serial_number": re.compile(r"(?:SN|S/N|Serial)[#\s]*(\d+)", re.IGNORECASE | re.ASCII),
+            "serial_alt": re.compile(r"Serial[:\s]+(\d+)", re.IGNORECASE | re.ASCII),
+            "machine_id": re.compile(r"Machine[:\s]+(\d+)", re.IGNORECASE | re.ASCII),
             
             # Additional patterns for better parameter extraction
             "parameter_with_units": re.compile(
@@ -156,7 +241,7 @@ class UnifiedParser:
                 r"([a-zA-Z%°/]+)??"                            # Optional unit
                 r"\s*"                                          # Optional space
                 r"(?:\(([^)]+)\))??"                           # Optional description in parentheses
-                , re.IGNORECASE
+                , re.IGNORECASE | re.ASCII
             ),
             
             # Enhanced logStatistics pattern
@@ -168,7 +253,7 @@ class UnifiedParser:
                 r"max\s*=\s*([\d.\-+eE]+)[,\s]*"              # max
                 r"min\s*=\s*([\d.\-+eE]+)[,\s]*"              # min
                 r"avg\s*=\s*([\d.\-+eE]+)",                   # avg
-                re.IGNORECASE
+                re.IGNORECASE | re.ASCII
             )
         }
 
@@ -480,13 +565,19 @@ class UnifiedParser:
 
         # Create pattern to unified name mapping
         self.pattern_to_unified = {}
+        # Reverse index of lowercase pattern -> unified name for O(1) exact lookups
+        self._pattern_index = {}
         for unified_name, config in self.parameter_mapping.items():
             for pattern in config["patterns"]:
-                key = pattern.lower().replace(" ", "").replace(":", "").replace("_", "")
+                key = pattern.lower().translate(_PATTERN_KEY_TABLE)
                 self.pattern_to_unified[key] = unified_name
+                self._pattern_index.setdefault(pattern.lower(), unified_name)
 
         # Cache for parameter normalization (performance optimization)
         self._param_cache = {}
+        # Raw name -> _normalize_parameter_name() result; logs repeat a few
+        # dozen names, so each is cleaned and looked up only once
+        self._normalized_names: Dict[str, str] = {}
 
     def parse_linac_file(
         self,
@@ -501,9 +592,10 @@ class UnifiedParser:
         # Initialize parsing statistics
         self.parsing_stats["parsing_start_time"] = time.time()
         self.parsing_stats["total_lines_read"] = 0
-        self.parsing_stats["skipped_reasons"] = {}
+        self.parsing_stats["skipped_reasons"] = Counter()
         
         records = []
+        line_number = 0
 
         try:
             # Optimized file reading - stream processing instead of loading entire file
@@ -514,17 +606,16 @@ class UnifiedParser:
             file_size = os.path.getsize(file_path)
             estimated_total_lines = file_size // 100  # Rough estimate: 100 bytes per line average
 
-            # Use buffered reading for better performance
-            with open(file_path, 'r', encoding='utf-8', buffering=8192) as file:
+            # Read through a 1 MiB buffer; 8 KiB reads cost noticeably more
+            # syscalls on multi-megabyte logs
+            with open(file_path, 'r', encoding='utf-8', buffering=1 << 20) as file:
                 chunk_lines = []
-                line_number = 0
 
                 for line in file:
                     if cancel_callback and cancel_callback():
                         break
 
                     line_number += 1
-                    self.parsing_stats["total_lines_read"] += 1
                     line = line.strip()
 
                     # Skip empty lines early
@@ -557,23 +648,53 @@ class UnifiedParser:
             print(f"Error reading file {file_path}: {e}")
             self.parsing_stats["errors_encountered"] += 1
 
-        df = pd.DataFrame(records)
+        # line_number counts every line read, blank ones included
+        self.parsing_stats["total_lines_read"] = line_number
+
+        raw_records_count = len(records)
+        df = self._records_to_dataframe(records)
+        # The frame holds the values now; free the row tuples before cleaning
+        # and merging make their own copies
+        del records
         cleaned_df = self._clean_and_validate_data(df)
+        del df
         
         # Apply parameter merging for equivalent parameters
         merged_df = self._merge_equivalent_parameters(cleaned_df)
+        del cleaned_df
+        
+        # Dictionary-encode the low-cardinality name columns so unique/==/groupby
+        # run on codes; value stays float64 to match the SQLite REAL column
+        categorical = [col for col in _CATEGORICAL_COLUMNS if col in merged_df.columns]
+        if categorical:
+            merged_df = merged_df.astype(dict.fromkeys(categorical, 'category'))
         
         # Update parsing statistics and log summary
-        self._update_parsing_statistics(len(records), merged_df)
+        self._update_parsing_statistics(raw_records_count, merged_df)
         self._log_parsing_summary(file_path)
         
         return merged_df
 
-    def _process_chunk(self, chunk_lines: List[Tuple[int, str]]) -> List[Dict]:
+    @staticmethod
+    def _records_to_dataframe(records: list) -> pd.DataFrame:
+        """Build the raw DataFrame from tab-log row tuples and combined-record dicts"""
+        rows = [record for record in records if type(record) is tuple]
+        if rows and len(rows) == len(records):
+            return pd.DataFrame.from_records(rows, columns=_RECORD_COLUMNS)
+        if not rows:
+            return pd.DataFrame(records)
+        # Mixed formats in one file: expand the tuples so columns keep the
+        # order of first appearance, as with all-dict records
+        return pd.DataFrame([
+            dict(zip(_RECORD_COLUMNS, record)) if type(record) is tuple else record
+            for record in records
+        ])
+
+    def _process_chunk(self, chunk_lines: List[Tuple[int, str]]) -> list:
         """Process a chunk of lines (legacy method for compatibility)"""
         return self._process_chunk_optimized(chunk_lines)
 
-    def _process_chunk_optimized(self, chunk_lines: List[Tuple[int, str]]) -> List[Dict]:
+    def _process_chunk_optimized(self, chunk_lines: List[Tuple[int, str]]) -> list:
         """Optimized chunk processing with strict parameter filtering from mapedname.txt"""
         records = []
 
@@ -582,56 +703,42 @@ class UnifiedParser:
         datetime_pattern = self.patterns["datetime"]
         datetime_alt_pattern = self.patterns["datetime_alt"]
         serial_pattern = self.patterns["serial_number"]
+        
+        # Per-chunk tallies, merged into parsing_stats once after the loop
+        unmapped_lines = 0
+        allowed_records = 0
 
         for line_number, line in chunk_lines:
             try:
-                self.parsing_stats["total_lines_read"] += 1
-                
                 # Detect if this is tab-separated format (new LINAC format)
                 if '\t' in line and line.count('\t') >= 7:
                     # STRICT PARAMETER FILTERING for tab-separated format
                     if self.enhanced_mapper:
-                        line_lower = line.lower()
-                        # Use O(1) set lookup for performance
-                        has_allowed_param = any(
-                            param_var in line_lower 
-                            for param_var in self.enhanced_mapper.parameter_variations
-                        )
+                        # One trie-regex pass instead of a substring search per variation
+                        has_allowed_param = self.enhanced_mapper.line_mentions_allowed_parameter(line.lower())
                         if not has_allowed_param:
-                            self.parsing_stats["parameters_skipped"] += 1
-                            self.parsing_stats["skipped_records"] += 1
-                            self.parsing_stats["skipped_reasons"]["unmapped_parameter"] = self.parsing_stats["skipped_reasons"].get("unmapped_parameter", 0) + 1
+                            unmapped_lines += 1
                             continue
                         
                         # Note: parameters_detected will be set from final unique dataset
                     
                     # Parse as tab-separated LINAC format
                     parsed_records = self._parse_tab_separated_line(line, line_number)
-                    if parsed_records:
-                        self.parsing_stats["parameters_allowed"] += len(parsed_records)
+                    allowed_records += len(parsed_records)
                     records.extend(parsed_records)
                 else:
                     # Early filtering - skip lines without statistics patterns
-                    has_statistics = any(keyword in line.lower() for keyword in [
-                        'count=', 'avg=', 'statistics', 'stat', 'max=', 'min=', 
-                        'value=', 'reading=', 'measurement='
-                    ])
-                    
-                    if not has_statistics:
+                    # (lower-case the line once for both filters below)
+                    line_lower = line.lower()
+                    if not any(map(line_lower.__contains__, _STATISTICS_KEYWORDS)):
                         continue
 
                     # STRICT PARAMETER FILTERING - Only process mapped parameters from mapedname.txt
                     if self.enhanced_mapper:
-                        line_lower = line.lower()
-                        # Use O(1) set lookup for performance
-                        has_allowed_param = any(
-                            param_var in line_lower 
-                            for param_var in self.enhanced_mapper.parameter_variations
-                        )
+                        # One trie-regex pass instead of a substring search per variation
+                        has_allowed_param = self.enhanced_mapper.line_mentions_allowed_parameter(line_lower)
                         if not has_allowed_param:
-                            self.parsing_stats["parameters_skipped"] += 1
-                            self.parsing_stats["skipped_records"] += 1
-                            self.parsing_stats["skipped_reasons"]["unmapped_parameter"] = self.parsing_stats["skipped_reasons"].get("unmapped_parameter", 0) + 1
+                            unmapped_lines += 1
                             continue
                         
                         # Note: parameters_detected will be set from final unique dataset
@@ -642,31 +749,36 @@ class UnifiedParser:
                     parsed_records = self._parse_line_optimized(line, line_number, 
                                                               water_pattern, datetime_pattern, 
                                                               datetime_alt_pattern, serial_pattern)
-                    if parsed_records:
-                        self.parsing_stats["parameters_allowed"] += len(parsed_records)
+                    allowed_records += len(parsed_records)
                     records.extend(parsed_records)
             except Exception as e:
                 self.parsing_stats["errors_encountered"] += 1
 
+        stats = self.parsing_stats
+        stats["parameters_allowed"] += allowed_records
+        if unmapped_lines:
+            stats["parameters_skipped"] += unmapped_lines
+            stats["skipped_records"] += unmapped_lines
+            stats["skipped_reasons"]["unmapped_parameter"] += unmapped_lines
+
         return records
 
-    def _parse_tab_separated_line(self, line: str, line_number: int) -> List[Dict]:
+    def _parse_tab_separated_line(self, line: str, line_number: int) -> List[tuple]:
         """Parse tab-separated LINAC log format (new format)"""
         records = []
         
         try:
             # Split by tabs - expected format:
             # Date      Time    Source  Level   Timestamp       SN#     System  Component       Message
-            parts = line.split('\t')
+            # Source, Level and Timestamp are not used, so they are not
+            # stripped; maxsplit leaves anything past Message unsplit
+            parts = line.split('\t', 9)
             if len(parts) < 9:
                 return records
                 
             date_str = parts[0].strip()
             time_str = parts[1].strip()
-            source = parts[2].strip()
-            level = parts[3].strip()
-            timestamp = parts[4].strip()
-            sn_field = parts[5].strip()
+            sn_field = parts[5]  # _extract_serial_from_field strips it
             system = parts[6].strip()
             component = parts[7].strip()
             message = parts[8].strip()
@@ -676,18 +788,18 @@ class UnifiedParser:
             
             # Create datetime
             try:
-                datetime_obj = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
+                datetime_obj = _parse_log_datetime(date_str, time_str)
             except ValueError:
                 return records
             
             # Check if message contains sensor data statistics
-            if 'logStatistics' in message and any(keyword in message for keyword in ['count=', 'max=', 'min=', 'avg=']):
+            if 'logStatistics' in message and any(map(message.__contains__, _STATISTIC_VALUE_KEYS)):
                 # Extract parameter data from message
                 param_records = self._extract_statistics_from_message(message, datetime_obj, serial_number, system, component, line_number)
                 records.extend(param_records)
             
-            # Check for temperature sensor data
-            if 'TemperatureSensor' in message or 'cpuTemperatureSensor' in message:
+            # Check for temperature sensor data (also matches cpuTemperatureSensor)
+            if 'TemperatureSensor' in message:
                 temp_records = self._extract_temperature_data(message, datetime_obj, serial_number, system, component, line_number)
                 records.extend(temp_records)
             
@@ -702,7 +814,7 @@ class UnifiedParser:
                 records.extend(odometer_records)
                 
             # Check for EMO and motion events
-            if any(event in message for event in ['EMO Good', 'Disable Motion', 'Enable Motion']):
+            if any(map(message.__contains__, _EVENT_MARKERS)):
                 event_records = self._extract_event_data(message, datetime_obj, serial_number, system, component, line_number)
                 records.extend(event_records)
                 
@@ -714,6 +826,14 @@ class UnifiedParser:
     
     def _extract_serial_from_field(self, sn_field: str) -> str:
         """Extract serial number from SN# field - handles multiple formats"""
+        serial = self._serials.get(sn_field)
+        if serial is None:
+            serial = self._serials[sn_field] = self._parse_serial_field(sn_field)
+        return serial
+
+    @staticmethod
+    def _parse_serial_field(sn_field: str) -> str:
+        """Parse one raw SN# field (uncached worker for _extract_serial_from_field)"""
         sn_field = sn_field.strip()
         
         # Handle different serial number formats found in logs
@@ -731,34 +851,24 @@ class UnifiedParser:
             return sn_field
         else:
             # Try to extract any number from the field
-            import re
-            match = re.search(r'(\d+)', sn_field)
+            match = _SERIAL_DIGITS_RE.search(sn_field)
             if match:
                 return match.group(1)
             else:
                 return sn_field  # Return as-is if no pattern matches
     
     def _extract_statistics_from_message(self, message: str, datetime_obj: datetime, 
-                                       serial_number: str, system: str, component: str, line_number: int) -> List[Dict]:
+                                       serial_number: str, system: str, component: str, line_number: int) -> List[tuple]:
         """Extract statistical data from log message"""
         records = []
         
-        # Pattern to match: logStatistics parameterName: count=X, max=Y, min=Z, avg=W
-        log_stats_pattern = re.compile(
-            r'logStatistics\s+([^:]+):\s*'
-            r'(?:count\s*=\s*(\d+)[,\s]*)?'
-            r'(?:max\s*=\s*([\d.\-+eE]+)[,\s]*)?'
-            r'(?:min\s*=\s*([\d.\-+eE]+)[,\s]*)?'
-            r'(?:avg\s*=\s*([\d.\-+eE]+))?',
-            re.IGNORECASE
-        )
-        
-        match = log_stats_pattern.search(message)
+        match = _LOG_STATS_RE.search(message)
         if match:
             param_name = match.group(1).strip()
             
             # STRICT PARAMETER FILTERING - Check if parameter is allowed before processing
-            if self.enhanced_mapper and not self.enhanced_mapper.is_parameter_allowed(param_name):
+            mapper = self.enhanced_mapper
+            if mapper and param_name not in mapper.allowed_set and not mapper.is_parameter_allowed(param_name):
                 return records  # Return empty list if parameter not allowed
             
             count = match.group(2)
@@ -797,21 +907,11 @@ class UnifiedParser:
         return records
     
     def _extract_temperature_data(self, message: str, datetime_obj: datetime, 
-                                 serial_number: str, system: str, component: str, line_number: int) -> List[Dict]:
+                                 serial_number: str, system: str, component: str, line_number: int) -> List[tuple]:
         """Extract temperature sensor data from message"""
         records = []
         
-        # Pattern for temperature sensors
-        temp_pattern = re.compile(
-            r'(cpuTemperatureSensor\d+|TemperatureSensor\d+):\s*'
-            r'(?:count\s*=\s*(\d+)[,\s]*)?'
-            r'(?:max\s*=\s*([\d.\-+eE]+)[,\s]*)?'
-            r'(?:min\s*=\s*([\d.\-+eE]+)[,\s]*)?'
-            r'(?:avg\s*=\s*([\d.\-+eE]+))?',
-            re.IGNORECASE
-        )
-        
-        match = temp_pattern.search(message)
+        match = _TEMP_SENSOR_RE.search(message)
         if match:
             sensor_name = match.group(1)
             count = match.group(2)
@@ -834,13 +934,12 @@ class UnifiedParser:
         return records
     
     def _extract_system_mode(self, message: str, datetime_obj: datetime, 
-                            serial_number: str, system: str, component: str, line_number: int) -> List[Dict]:
+                            serial_number: str, system: str, component: str, line_number: int) -> List[tuple]:
         """Extract system mode information"""
         records = []
         
         # Pattern: "MachineSerialNumber:2182 SystemMode:SERVICE"
-        mode_pattern = re.compile(r'SystemMode:(\w+)', re.IGNORECASE)
-        match = mode_pattern.search(message)
+        match = _SYSTEM_MODE_RE.search(message)
         
         if match:
             mode = match.group(1)
@@ -852,7 +951,7 @@ class UnifiedParser:
         return records
     
     def _extract_odometer_data(self, message: str, datetime_obj: datetime, 
-                              serial_number: str, system: str, component: str, line_number: int) -> List[Dict]:
+                              serial_number: str, system: str, component: str, line_number: int) -> List[tuple]:
         """Extract odometer-related data"""
         records = []
         
@@ -871,7 +970,7 @@ class UnifiedParser:
         return records
     
     def _extract_event_data(self, message: str, datetime_obj: datetime, 
-                           serial_number: str, system: str, component: str, line_number: int) -> List[Dict]:
+                           serial_number: str, system: str, component: str, line_number: int) -> List[tuple]:
         """Extract system events like EMO, motion control"""
         records = []
         
@@ -894,19 +993,10 @@ class UnifiedParser:
         return records
     
     def _create_record(self, datetime_obj: datetime, parameter_name: str, value, unit: str, 
-                      serial_number: str, system: str, component: str, line_number: int) -> Dict:
-        """Create a standardized data record"""
-        return {
-            'datetime': datetime_obj,
-            'parameter': parameter_name,
-            'value': value,
-            'unit': unit,
-            'serial_number': serial_number,
-            'system': system,
-            'component': component,
-            'line_number': line_number,
-            'source': 'tab_separated_log'
-        }
+                      serial_number: str, system: str, component: str, line_number: int) -> tuple:
+        """Create a standardized data record as a row tuple in _RECORD_COLUMNS order"""
+        return (datetime_obj, parameter_name, value, unit, serial_number,
+                system, component, line_number, 'tab_separated_log')
     
     def _get_unit_for_parameter(self, param_name: str) -> str:
         """Get the appropriate unit for a parameter"""
@@ -951,7 +1041,7 @@ class UnifiedParser:
 
         if not datetime_str:
             self.parsing_stats["skipped_records"] += 1
-            self.parsing_stats["skipped_reasons"]["no_datetime"] = self.parsing_stats["skipped_reasons"].get("no_datetime", 0) + 1
+            self.parsing_stats["skipped_reasons"]["no_datetime"] += 1
             return records
 
         # Extract serial number (cached for performance)
@@ -966,9 +1056,10 @@ class UnifiedParser:
             param_name = water_match.group(1).strip()
 
             # STRICT PARAMETER FILTERING - only process parameters from mapedname.txt
-            if self.enhanced_mapper and not self.enhanced_mapper.is_parameter_allowed(param_name):
+            mapper = self.enhanced_mapper
+            if mapper and param_name not in mapper.allowed_set and not mapper.is_parameter_allowed(param_name):
                 self.parsing_stats["skipped_records"] += 1
-                self.parsing_stats["skipped_reasons"]["unmapped_parameter"] = self.parsing_stats["skipped_reasons"].get("unmapped_parameter", 0) + 1
+                self.parsing_stats["skipped_reasons"]["unmapped_parameter"] += 1
                 return records  # Skip parameters not in mapedname.txt
 
             # Check if parameter should be merged
@@ -992,7 +1083,7 @@ class UnifiedParser:
                 
             except (ValueError, IndexError):
                 self.parsing_stats["skipped_records"] += 1
-                self.parsing_stats["skipped_reasons"]["malformed_data"] = self.parsing_stats["skipped_reasons"].get("malformed_data", 0) + 1
+                self.parsing_stats["skipped_reasons"]["malformed_data"] += 1
                 return records  # Skip malformed numeric data
 
             record = {
@@ -1061,16 +1152,22 @@ class UnifiedParser:
 
     def _normalize_parameter_name(self, param_name: str) -> str:
         """Normalize parameter names to fix common naming issues"""
+        normalized = self._normalized_names.get(param_name)
+        if normalized is not None:
+            return normalized
+        
         # Clean parameter name - remove logStatistics prefix if present
         cleaned_param = param_name.strip()
         if cleaned_param.lower().startswith('logstatistics '):
             cleaned_param = cleaned_param[14:]  # Remove "logStatistics " prefix
 
         # Remove spaces, colons, underscores, convert to lowercase for lookup
-        lookup_key = cleaned_param.lower().replace(" ", "").replace(":", "").replace("_", "")
+        lookup_key = cleaned_param.lower().translate(_PATTERN_KEY_TABLE)
 
         # Return unified name if found, otherwise return cleaned original
-        return self.pattern_to_unified.get(lookup_key, cleaned_param.strip())
+        normalized = self.pattern_to_unified.get(lookup_key, cleaned_param.strip())
+        self._normalized_names[param_name] = normalized
+        return normalized
 
     def _normalize_parameter_name_cached(self, param_name: str) -> str:
         """Cached version of parameter normalization using enhanced mapper when available"""
@@ -1091,11 +1188,10 @@ class UnifiedParser:
             cleaned_param = cleaned_param[14:]  # Remove "logStatistics " prefix
 
         # First try exact match
-        for unified_name, config in self.parameter_mapping.items():
-            for pattern in config["patterns"]:
-                if pattern.lower() == cleaned_param.lower():
-                    self._param_cache[param_name] = unified_name
-                    return unified_name
+        unified_name = self._pattern_index.get(cleaned_param.lower())
+        if unified_name is not None:
+            self._param_cache[param_name] = unified_name
+            return unified_name
 
         # Then try pattern matching with full string contains
         for unified_name, config in self.parameter_mapping.items():
@@ -1105,7 +1201,7 @@ class UnifiedParser:
                     return unified_name
 
         # Fallback to cleaned lookup
-        lookup_key = cleaned_param.lower().replace(" ", "").replace(":", "").replace("_", "")
+        lookup_key = cleaned_param.lower().translate(_PATTERN_KEY_TABLE)
         result = self.pattern_to_unified.get(lookup_key, None)
         self._param_cache[param_name] = result
         return result
@@ -1123,7 +1219,7 @@ class UnifiedParser:
         if cleaned_param.lower().startswith('logstatistics '):
             cleaned_param = cleaned_param[14:]  # Remove "logStatistics " prefix
 
-        param_lower = cleaned_param.lower().replace(" ", "").replace(":", "").replace("_", "")
+        param_lower = cleaned_param.lower().translate(_PATTERN_KEY_TABLE)
 
         # Expanded target keywords to extract more data points
         target_keywords = [
@@ -1166,11 +1262,11 @@ class UnifiedParser:
         target_patterns = []
         for param_config in self.parameter_mapping.values():
             for pattern in param_config["patterns"]:
-                target_patterns.append(pattern.lower().replace(" ", "").replace(":", "").replace("_", ""))
+                target_patterns.append(pattern.lower().translate(_PATTERN_KEY_TABLE))
 
         # Check if the parameter name contains any of our target patterns
         for pattern in target_patterns:
-            pattern_clean = pattern.lower().replace(" ", "").replace(":", "").replace("_", "")
+            pattern_clean = pattern.lower().translate(_PATTERN_KEY_TABLE)
             if pattern_clean in param_lower or param_lower in pattern_clean:
                 return True
 
@@ -1228,29 +1324,11 @@ class UnifiedParser:
 
             # Fix column names for database compatibility
             if 'parameter' in df.columns:
-                # Split parameter into base parameter and statistic type
-                parameter_types = []
-                statistic_types = []
-                
-                for param in df['parameter']:
-                    if param.endswith('_avg'):
-                        parameter_types.append(param[:-4])
-                        statistic_types.append('avg')
-                    elif param.endswith('_max'):
-                        parameter_types.append(param[:-4])
-                        statistic_types.append('max')
-                    elif param.endswith('_min'):
-                        parameter_types.append(param[:-4])
-                        statistic_types.append('min')
-                    elif param.endswith('_count'):
-                        parameter_types.append(param[:-6])
-                        statistic_types.append('count')
-                    else:
-                        parameter_types.append(param)
-                        statistic_types.append('avg')  # Default to avg
-                
-                df['parameter_type'] = parameter_types
-                df['statistic_type'] = statistic_types
+                # Split parameter into base parameter and statistic type in one
+                # vectorized pass; names without a known suffix default to avg
+                split = df['parameter'].str.extract(r'^(.*?)(?:_(avg|max|min|count))?$')
+                df['parameter_type'] = split[0]
+                df['statistic_type'] = split[1].fillna('avg')
                 
                 # Keep both 'param' for UI compatibility and 'parameter_type' for database
                 df['param'] = df['parameter_type']  # For UI compatibility
@@ -1341,59 +1419,43 @@ class UnifiedParser:
             # Remove rows where value couldn't be converted to numeric
             validated_df = validated_df.dropna(subset=[value_column])
         
-        # Apply parameter-specific validation rules
-        for param_type in validated_df['parameter_type'].unique():
-            param_data = validated_df[validated_df['parameter_type'] == param_type]
-            
-            if param_data.empty or not value_column:
-                continue
-                
-            # Get expected range for this parameter
-            expected_range = self._get_parameter_range(param_type)
+        param_types = validated_df['parameter_type']
+        if not value_column or validated_df.empty:
+            return validated_df
+        
+        # Apply parameter-specific validation rules in one pass: look up each
+        # distinct type's range once, broadcast it to the rows and compare the
+        # whole value column, instead of filtering and assigning per type
+        ranges = {}
+        for param_type in param_types.unique():
+            if pd.notna(param_type):
+                expected_range = self._get_parameter_range(param_type)
+                if expected_range:
+                    ranges[param_type] = expected_range
+        if not ranges:
+            return validated_df
+        
+        bounds = pd.DataFrame.from_dict(ranges, orient='index', columns=['min', 'max'])
+        values = validated_df[value_column]
+        out_of_range = (values < param_types.map(bounds['min'])) | (values > param_types.map(bounds['max']))
+        if out_of_range.any():
+            # Mark as poor quality instead of removing
+            validated_df.loc[out_of_range, 'data_quality'] = 'poor'
             
-            if expected_range:
-                min_val, max_val = expected_range
-                
-                try:
-                    # Flag values outside expected range
-                    mask = (param_data[value_column] < min_val) | (param_data[value_column] > max_val)
-                    outliers = mask.sum()
-                    
-                    if outliers > 0:
-                        # Mark as poor quality instead of removing
-                        validated_df.loc[
-                            (validated_df['parameter_type'] == param_type) & mask, 
-                            'data_quality'
-                        ] = 'poor'
-                        
-                        if outliers <= 5:  # Only show details for small number of outliers
-                            print(f"🔍 Found {outliers} outliers for {param_type} (expected: {min_val}-{max_val})")
-                except Exception as e:
-                    # Skip validation for this parameter if there are data type issues
-                    print(f"⚠️ Skipping validation for {param_type}: {str(e)[:50]}")
-                    continue
+            outlier_counts = param_types[out_of_range].value_counts()
+            for param_type, (min_val, max_val) in ranges.items():
+                outliers = outlier_counts.get(param_type, 0)
+                if 0 < outliers <= 5:  # Only show details for small number of outliers
+                    print(f"🔍 Found {outliers} outliers for {param_type} (expected: {min_val}-{max_val})")
         
         return validated_df
     
     def _get_parameter_range(self, param_type: str) -> Optional[Tuple[float, float]]:
         """Get expected range for a parameter type"""
-        # Parameter-specific ranges based on typical LINAC values
-        ranges = {
-            'magnetronFlow': (8.0, 18.0),
-            'targetAndCirculatorFlow': (8.0, 18.0),
-            'magnetronTemp': (20.0, 80.0),
-            'targetAndCirculatorTemp': (20.0, 80.0),
-            'sf6GasPressure': (10.0, 50.0),
-            'boardTemperature': (20.0, 80.0),
-            'cpuTemperatureSensor0': (20.0, 80.0),
-            'cpuTemperatureSensor1': (20.0, 80.0),
-            'humidity': (0.0, 100.0),
-            'fanSpeed': (0.0, 5000.0),
-        }
-        
         # Try exact match first
-        if param_type in ranges:
-            return ranges[param_type]
+        param_range = self._PARAMETER_RANGES.get(param_type)
+        if param_range is not None:
+            return param_range
         
         # Try partial matching for common parameter types
         param_lower = param_type.lower()
@@ -1743,8 +1805,7 @@ class UnifiedParser:
 
                 # Create datetime
                 try:
-                    datetime_str = f"{date_str} {time_str}"
-                    dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
+                    dt = _parse_log_datetime(date_str, time_str)
                 except:
                     dt = None
 